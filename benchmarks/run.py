@@ -0,0 +1,244 @@
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import sys
+import time
+import timeit
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from pycomcigan import ComciganClient, TimeTable, TimeTableCache, code_cache, fetch_many
+from pycomcigan.codes import CODE_PATTERNS, parse_comcigan_codes
+from pycomcigan.fake_server import DEFAULT_CODES, FakeComciganServer, make_st_page, make_timetable_payload
+from pycomcigan.parsing import first_line, loads, orjson
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+# Shape of a large high school payload
+LARGE_SCHOOL = {'grades': 3, 'classes': 20, 'periods': 8}
+
+# Script filler bringing the fake /st page to roughly the size of the real one (~100 KB)
+ST_FILLER = "function 표시(자료){var 요일=자료.요일; var 교시=자료.교시; return 요일+'('+교시+')';}\n" * 1200
+
+BENCHMARKS: Dict[str, Callable] = {}
+
+
+def benchmark(name: str):
+    """
+    Register a benchmark. The function receives the fake server and returns the
+    callable to time, or None to skip it (e.g. an optional dependency is missing).
+    """
+    def decorator(setup: Callable) -> Callable:
+        BENCHMARKS[name] = setup
+        return setup
+    return decorator
+
+
+def _codes_tuple() -> tuple:
+    return parse_comcigan_codes(make_st_page(DEFAULT_CODES))
+
+
+@benchmark('scrape_codes')
+def bench_scrape_codes(server: FakeComciganServer):
+    page = make_st_page(DEFAULT_CODES)
+    return lambda: parse_comcigan_codes(page)
+
+
+def _findall_codes(content: str) -> tuple:
+    """Code extraction with findall over the whole page, as before, for comparison."""
+    return tuple(re.findall(pattern, content)[0][part] for pattern, part in CODE_PATTERNS.values())
+
+
+@benchmark('scrape_codes_large')
+def bench_scrape_codes_large(server: FakeComciganServer):
+    page = ST_FILLER + make_st_page(DEFAULT_CODES) + ST_FILLER
+    return lambda: parse_comcigan_codes(page)
+
+
+@benchmark('scrape_codes_large_findall')
+def bench_scrape_codes_large_findall(server: FakeComciganServer):
+    page = ST_FILLER + make_st_page(DEFAULT_CODES) + ST_FILLER
+    return lambda: _findall_codes(page)
+
+
+@benchmark('parse_timetable_json')
+def bench_parse_timetable_json(server: FakeComciganServer):
+    text = json.dumps(make_timetable_payload(DEFAULT_CODES, **LARGE_SCHOOL), ensure_ascii=False) + '\n'
+    return lambda: TimeTable._parse_timetable_response(text)
+
+
+def _timetable_body() -> bytes:
+    return json.dumps(make_timetable_payload(DEFAULT_CODES, **LARGE_SCHOOL), ensure_ascii=False).encode('utf-8') + b'\n'
+
+
+@benchmark('parse_timetable_bytes')
+def bench_parse_timetable_bytes(server: FakeComciganServer):
+    body = _timetable_body()
+    return lambda: TimeTable._parse_timetable_response(body)
+
+
+@benchmark('parse_timetable_decode_split')
+def bench_parse_timetable_decode_split(server: FakeComciganServer):
+    body = _timetable_body()
+    # Decoding the whole body and splitting it, as before the parser layer, with the same JSON backend
+    return lambda: loads(body.decode('utf-8').split('\n')[0])
+
+
+@benchmark('parse_json_stdlib')
+def bench_parse_json_stdlib(server: FakeComciganServer):
+    line = first_line(_timetable_body())
+    return lambda: json.loads(line)
+
+
+@benchmark('parse_json_orjson')
+def bench_parse_json_orjson(server: FakeComciganServer):
+    if orjson is None:
+        return None
+    line = first_line(_timetable_body())
+    return lambda: orjson.loads(line)
+
+
+@benchmark('build_timetable_eager')
+def bench_build_timetable_eager(server: FakeComciganServer):
+    data = make_timetable_payload(DEFAULT_CODES, **LARGE_SCHOOL)
+    codes = _codes_tuple()
+    return lambda: TimeTable._from_data(data, 24966, "경기북과학고등학교", 12045, codes)
+
+
+@benchmark('build_timetable_lazy')
+def bench_build_timetable_lazy(server: FakeComciganServer):
+    data = make_timetable_payload(DEFAULT_CODES, **LARGE_SCHOOL)
+    codes = _codes_tuple()
+    return lambda: TimeTable._from_data(data, 24966, "경기북과학고등학교", 12045, codes, lazy=True)
+
+
+@benchmark('export_numpy')
+def bench_export_numpy(server: FakeComciganServer):
+    data = make_timetable_payload(DEFAULT_CODES, **LARGE_SCHOOL)
+    timetable = TimeTable._from_data(data, 24966, "경기북과학고등학교", 12045, _codes_tuple(), lazy=True)
+    return timetable.to_numpy
+
+
+@benchmark('timetable_end_to_end')
+def bench_timetable_end_to_end(server: FakeComciganServer):
+    client = ComciganClient(server.url)
+    return lambda: TimeTable("경기북과학고", client=client)
+
+
+@benchmark('timetable_end_to_end_cold')
+def bench_timetable_end_to_end_cold(server: FakeComciganServer):
+    def run():
+        code_cache.invalidate()
+        with ComciganClient(server.url) as client:
+            TimeTable("경기북과학고", client=client)
+    return run
+
+
+@benchmark('timetable_cache_hit')
+def bench_timetable_cache_hit(server: FakeComciganServer):
+    cache = TimeTableCache(client=ComciganClient(server.url))
+    return lambda: cache.get("경기북과학고")
+
+
+@benchmark('fetch_many_30')
+def bench_fetch_many(server: FakeComciganServer):
+    client = ComciganClient(server.url, pool_maxsize=8)
+    schools = [(school[2], school[0], school[3]) for school in server.schools] * 10
+    return lambda: list(fetch_many(schools, client=client))
+
+
+def measure(func: Callable, min_time: float, repeat: int) -> dict:
+    """Time func with an automatically chosen number of calls per round."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    rounds = [elapsed / number for elapsed in timer.repeat(repeat=repeat, number=number)]
+    return {
+        'number': number,
+        'repeat': repeat,
+        'min': min(rounds),
+        'median': statistics.median(rounds),
+    }
+
+
+def run(names: List[str], min_time: float, repeat: int, latency: float) -> dict:
+    results = {}
+    with FakeComciganServer(latency=latency, **LARGE_SCHOOL) as server:
+        for name in names:
+            func = BENCHMARKS[name](server)
+            if func is None:
+                print(f"{name:<30} {'skipped':>13}")
+                continue
+            func()  # Warm up caches and connections
+            results[name] = measure(func, min_time, repeat)
+            print(f"{name:<30} {results[name]['min'] * 1000:>10.3f} ms")
+    return results
+
+
+def compare(results: dict, baseline_path: str) -> None:
+    with open(baseline_path, encoding='utf-8') as file:
+        baseline = json.load(file)['results']
+
+    print(f"\n{'benchmark':<30} {'baseline':>12} {'current':>12} {'ratio':>8}")
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        old = baseline[name]['min']
+        new = result['min']
+        print(f"{name:<30} {old * 1000:>10.3f}ms {new * 1000:>10.3f}ms {new / old:>7.2f}x")
+
+
+def _version() -> str:
+    try:
+        from importlib.metadata import version
+        return version('pycomcigan')
+    except Exception:
+        return 'dev'
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='pycomcigan benchmarks against a local fake Comcigan server')
+    parser.add_argument('names', nargs='*', help='benchmarks to run (default: all)')
+    parser.add_argument('--min-time', type=float, default=0.2, help='seconds per timing round')
+    parser.add_argument('--repeat', type=int, default=5, help='timing rounds per benchmark')
+    parser.add_argument('--latency', type=float, default=0.0, help='fake server latency in seconds')
+    parser.add_argument('--output', help='result file (default: benchmarks/results/<version>-<time>.json)')
+    parser.add_argument('--compare', help='previous result file to compare against')
+    parser.add_argument('--list', action='store_true', help='list benchmarks and exit')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print('\n'.join(BENCHMARKS))
+        return
+
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    results = run(args.names or list(BENCHMARKS), args.min_time, args.repeat, args.latency)
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"{_version()}-{datetime.now():%Y%m%d-%H%M%S}.json")
+    with open(output, 'w', encoding='utf-8') as file:
+        json.dump({
+            'version': _version(),
+            'created': time.time(),
+            'python': sys.version,
+            'platform': platform.platform(),
+            'latency': args.latency,
+            'json_backend': 'orjson' if orjson is not None else 'json',
+            'results': results,
+        }, file, indent=2)
+    print(f"\nSaved to {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
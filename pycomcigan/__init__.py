@@ -1,2 +1,13 @@
 from .timetable import TimeTable
-from .search_school import get_school_code
\ No newline at end of file
+from .search_school import get_school_code
+from .client import ComciganClient, get_default_client, set_default_client
+from .policy import CircuitBreaker, CircuitOpenError, RequestPolicy
+from .codes import CodeCache, code_cache
+from .aio import AsyncComciganClient, AsyncTimeTable
+from .bulk import FetchResult, RateLimiter, fetch_many
+from .index import Slot, TimeTableIndex
+from .changes import Change, diff
+from .directory import SchoolDirectory
+from .instrumentation import PhaseEvent, TimingStats, instrument
+from .columnar import TimeTableArrays
+from .cache import TimeTableCache
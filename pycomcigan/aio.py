@@ -0,0 +1,493 @@
+import asyncio
+import time
+from abc import ABC, abstractmethod
+import weakref
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+from urllib.parse import urlsplit
+
+from .changes import Change
+from .client import COMCIGAN_URL, HEADERS
+from .codes import DEFAULT_CODE_TTL, STALE_CODE_ERRORS, ComciganCodes, parse_comcigan_codes
+from .instrumentation import (CODE_CACHE, CODE_PARSE, JSON_PARSE, SEARCH, ST_DOWNLOAD, TIMETABLE_DOWNLOAD, TOTAL,
+                              current_observer, emit)
+from .policy import CircuitOpenError, RequestPolicy, Timeout
+from .timetable import TimeTable
+
+try:
+    import aiohttp
+    from yarl import URL
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+T = TypeVar('T')
+
+# Errors of a request that never got an answer, retried like requests' ConnectionError and Timeout
+CONNECTION_ERRORS: Tuple[type, ...] = (OSError, asyncio.TimeoutError)
+if aiohttp is not None:
+    CONNECTION_ERRORS += (aiohttp.ClientConnectionError,)
+
+
+class HTTPStatusError(RuntimeError):
+    """Raised by the async transports for HTTP error responses."""
+
+    def __init__(self, status: int, url: str):
+        super().__init__(f'HTTP {status} for {url}')
+        self.status = status
+        self.url = url
+
+
+class AsyncTransport(ABC):
+    """Minimal interface of an async HTTP transport used by AsyncComciganClient."""
+
+    @abstractmethod
+    async def get(self, url: str, headers: Dict[str, str], timeout: Optional[float]) -> bytes:
+        """Send a GET request and return the response body, raising HTTPStatusError for error statuses."""
+
+    async def close(self) -> None:
+        """Release any resources held by the transport."""
+
+
+class AiohttpTransport(AsyncTransport):
+    """Transport backed by a pooled aiohttp.ClientSession."""
+
+    def __init__(self, limit: int = 100):
+        if aiohttp is None:
+            raise RuntimeError('aiohttp is not installed')
+        self._limit = limit
+        self._session: Optional['aiohttp.ClientSession'] = None
+
+    async def get(self, url: str, headers: Dict[str, str], timeout: Optional[float]) -> bytes:
+        if self._session is None:
+            self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self._limit))
+
+        # The server sends raw bytes we decode ourselves, so disable URL re-quoting
+        async with self._session.get(URL(url, encoded=True), headers=headers,
+                                     timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            if response.status >= 400:
+                raise HTTPStatusError(response.status, url)
+            return await response.read()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class StdlibTransport(AsyncTransport):
+    """Pure-stdlib HTTP/1.1 transport on top of asyncio streams (plain http only)."""
+
+    async def get(self, url: str, headers: Dict[str, str], timeout: Optional[float]) -> bytes:
+        return await asyncio.wait_for(self._get(url, headers), timeout)
+
+    @staticmethod
+    async def _get(url: str, headers: Dict[str, str]) -> bytes:
+        parts = urlsplit(url)
+        if parts.scheme != 'http':
+            raise ValueError('StdlibTransport only supports http URLs')
+
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+
+        reader, writer = await asyncio.open_connection(parts.hostname, parts.port or 80)
+        try:
+            request_lines = [f'GET {path} HTTP/1.1', f'Host: {parts.netloc}', 'Connection: close']
+            request_lines += [f'{key}: {value}' for key, value in headers.items()]
+            writer.write(('\r\n'.join(request_lines) + '\r\n\r\n').encode('latin-1'))
+            await writer.drain()
+
+            raw = await reader.read()
+        finally:
+            writer.close()
+
+        head, _, body = raw.partition(b'\r\n\r\n')
+        status_line, *header_lines = head.decode('latin-1').split('\r\n')
+        status = int(status_line.split()[1])
+        if status >= 400:
+            raise HTTPStatusError(status, url)
+
+        response_headers = {}
+        for line in header_lines:
+            key, _, value = line.partition(':')
+            response_headers[key.strip().lower()] = value.strip()
+
+        if response_headers.get('transfer-encoding', '').lower() == 'chunked':
+            body = StdlibTransport._dechunk(body)
+        return body
+
+    @staticmethod
+    def _dechunk(body: bytes) -> bytes:
+        """Decode a chunked transfer-encoded body."""
+        chunks = []
+        position = 0
+        while True:
+            line_end = body.index(b'\r\n', position)
+            size = int(body[position:line_end].split(b';')[0], 16)
+            if size == 0:
+                break
+            chunks.append(body[line_end + 2:line_end + 2 + size])
+            position = line_end + 2 + size + 2
+        return b''.join(chunks)
+
+
+class AsyncComciganClient:
+    """
+    Asyncio client for the Comcigan server.
+
+    Limits the number of requests in flight and shares a single service-code
+    fetch between every request made through it. Every request goes through
+    the client's RequestPolicy (retries, hedging and circuit breaking), like
+    with ComciganClient.
+    """
+
+    def __init__(self, base_url: str = COMCIGAN_URL, transport: Optional[AsyncTransport] = None,
+                 max_concurrency: int = 10, timeout: Optional[float] = None, code_ttl: float = DEFAULT_CODE_TTL,
+                 policy: Optional[RequestPolicy] = None):
+        """
+        Args:
+            base_url (str): Comcigan server URL
+            transport (AsyncTransport, optional): HTTP transport (default: aiohttp if installed, else stdlib)
+            max_concurrency (int): Maximum number of requests in flight
+            timeout (float, optional): Total timeout per request attempt in seconds
+                (default: the policy's timeout, a (connect, read) timeout counting as their sum)
+            code_ttl (float): Seconds the fetched service codes stay valid
+            policy (RequestPolicy, optional): Timeouts, retries, hedging and circuit breaking
+                (default: RequestPolicy())
+        """
+        if transport is None:
+            transport = AiohttpTransport() if aiohttp is not None else StdlibTransport()
+
+        self.base_url = base_url.rstrip('/')
+        self.transport = transport
+        self.policy = policy or RequestPolicy()
+        self.timeout = timeout if timeout is not None else self._total_timeout(self.policy.timeout)
+        self.code_ttl = code_ttl
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._codes_task: Optional[asyncio.Task] = None
+        self._codes_expires_at = 0.0
+
+    async def get(self, path: str, encoding: str = 'UTF-8') -> str:
+        """
+        Send a GET request for a path on the Comcigan server.
+
+        Args:
+            path (str): Path (and query) appended to base_url
+            encoding (str): Encoding used to decode the response body
+
+        Returns:
+            str: The decoded response body
+
+        Raises:
+            CircuitOpenError: If the policy's circuit breaker is open
+            HTTPStatusError: If the server answered with an error status, after all retries for RETRY_STATUSES
+        """
+        return (await self._get_body(path)).decode(encoding)
+
+    @staticmethod
+    def _total_timeout(timeout: Timeout) -> Optional[float]:
+        return sum(timeout) if isinstance(timeout, tuple) else timeout
+
+    async def _get_body(self, path: str) -> bytes:
+        """Send a GET request with the policy applied and return the raw response body."""
+        url = self.base_url + path
+        policy = self.policy
+        for attempt in range(policy.retries + 1):
+            if attempt:
+                await asyncio.sleep(policy.backoff_delay(attempt - 1))
+            if policy.breaker is not None and not policy.breaker.allow():
+                raise CircuitOpenError('Comcigan circuit breaker is open')
+
+            try:
+                body = await self._send(url)
+            except HTTPStatusError as error:
+                if error.status not in policy.retry_statuses:
+                    # The server answered, so it is up
+                    if policy.breaker is not None:
+                        policy.breaker.record_success()
+                    raise
+                policy._record_failure()
+                if attempt == policy.retries:
+                    raise
+                continue
+            except CONNECTION_ERRORS:
+                policy._record_failure()
+                if attempt == policy.retries:
+                    raise
+                continue
+            except Exception:
+                # Not retried, but still ends a half-open trial
+                policy._record_failure()
+                raise
+
+            if policy.breaker is not None:
+                policy.breaker.record_success()
+            return body
+
+    async def _send(self, url: str) -> bytes:
+        """Send once, hedging and recording the latency if the policy hedges."""
+        if not self.policy.hedge:
+            return await self._send_once(url)
+
+        start = time.perf_counter()
+        delay = self.policy.hedge_delay()
+        if delay is None:
+            body = await self._send_once(url)
+        else:
+            body = await self._send_hedged(url, delay)
+        self.policy._record_latency(time.perf_counter() - start)
+        return body
+
+    async def _send_once(self, url: str) -> bytes:
+        if self._semaphore is None:
+            # Created lazily so it binds to the loop the client is used on
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with self._semaphore:
+            return await self.transport.get(url, HEADERS, self.timeout)
+
+    async def _send_hedged(self, url: str, delay: float) -> bytes:
+        """Send a second request if the first hasn't answered after `delay` and return the first to succeed."""
+        tasks = [asyncio.ensure_future(self._send_once(url))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done:
+                tasks.append(asyncio.ensure_future(self._send_once(url)))
+
+            pending = set(tasks)
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            # Unlike threads, the slower request can be cancelled
+            for task in tasks:
+                task.cancel()
+
+    async def _get_timed(self, path: str, phase: str) -> bytes:
+        """Like _get_body(), but report the request as `phase` to the current observer."""
+        observer = current_observer()
+        start = time.perf_counter() if observer is not None else 0.0
+        body = await self._get_body(path)
+        if observer is not None:
+            emit(observer, phase, start, len(body))
+        return body
+
+    async def get_codes(self) -> ComciganCodes:
+        """
+        Return the service codes, fetching /st at most once for all concurrent callers.
+
+        Returns:
+            ComciganCodes: (comcigan_code, code0, code1, code2, code3, code4, code5)
+        """
+        observer = current_observer()
+        start = time.perf_counter() if observer is not None else 0.0
+
+        task = self._codes_task
+        cache_hit = True
+        if task is None or (task.done() and (task.exception() is not None or
+                                             time.monotonic() >= self._codes_expires_at)):
+            task = asyncio.ensure_future(self._fetch_codes())
+            self._codes_task = task
+            cache_hit = False
+        codes = await asyncio.shield(task)
+
+        if observer is not None:
+            emit(observer, CODE_CACHE, start, cache_hit=cache_hit)
+        return codes
+
+    async def _fetch_codes(self) -> ComciganCodes:
+        body = await self._get_timed('/st', ST_DOWNLOAD)
+
+        observer = current_observer()
+        start = time.perf_counter() if observer is not None else 0.0
+        codes = parse_comcigan_codes(body.decode('euc-kr'))
+        if observer is not None:
+            emit(observer, CODE_PARSE, start, len(body))
+
+        self._codes_expires_at = time.monotonic() + self.code_ttl
+        return codes
+
+    def invalidate_codes(self, codes: Optional[ComciganCodes] = None) -> None:
+        """Drop the cached service codes (only if they still equal `codes`, when given)."""
+        task = self._codes_task
+        if task is None or not task.done():
+            return
+        if codes is None or (task.exception() is None and task.result() == codes):
+            self._codes_task = None
+
+    async def call_with_codes(self, func: Callable[[ComciganCodes], Awaitable[T]],
+                              codes: Optional[ComciganCodes] = None) -> Tuple[T, ComciganCodes]:
+        """
+        Await func with the service codes, refetching them and retrying once if they have rotated.
+
+        The async twin of CodeCache.call_with_codes(). Error statuses the policy
+        already retried are not taken for rotated codes.
+
+        Args:
+            func (Callable): Coroutine function sending and parsing requests with the given codes
+            codes (ComciganCodes, optional): Codes to try first (default: the cached ones)
+
+        Returns:
+            Tuple: The result of func and the codes it succeeded with
+        """
+        codes = codes if codes is not None else await self.get_codes()
+        try:
+            return await func(codes), codes
+        except STALE_CODE_ERRORS + (HTTPStatusError,) as error:
+            if isinstance(error, HTTPStatusError) and error.status in self.policy.retry_statuses:
+                raise
+            # The service codes have most likely rotated - refetch them and retry once
+            self.invalidate_codes(codes)
+            codes = await self.get_codes()
+            return await func(codes), codes
+
+    async def close(self) -> None:
+        """Close the underlying transport."""
+        await self.transport.close()
+
+    async def __aenter__(self) -> 'AsyncComciganClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+_default_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncComciganClient]' = \
+    weakref.WeakKeyDictionary()
+
+
+def get_default_async_client() -> AsyncComciganClient:
+    """Return the client shared by the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _default_clients.get(loop)
+    if client is None:
+        client = AsyncComciganClient()
+        _default_clients[loop] = client
+    return client
+
+
+async def get_school_code(school_name: str, client: Optional[AsyncComciganClient] = None) -> List[List]:
+    """
+    Search for schools by name and return their information.
+
+    Args:
+        school_name (str): Name of the school to search for
+        client (AsyncComciganClient, optional): Client used for the requests (default: per-loop client)
+
+    Returns:
+        List[List]: List of school information in format:
+                   [[region_code, region_name, school_name, school_code], ...]
+    """
+    client = client or get_default_async_client()
+    search_results, _ = await client.call_with_codes(lambda codes: _search(client, codes[0], school_name))
+    return search_results
+
+
+async def _search(client: AsyncComciganClient, comcigan_code: str, school_name: str) -> List[List]:
+    """Send a school search request and parse it, reporting both as the search phase."""
+    observer = current_observer()
+    start = time.perf_counter() if observer is not None else 0.0
+    body = await client._get_body(TimeTable._search_path(comcigan_code, school_name))
+    search_results = TimeTable._parse_search_response(body)
+    if observer is not None:
+        emit(observer, SEARCH, start, len(body))
+    return search_results
+
+
+class AsyncTimeTable(TimeTable):
+    """
+    TimeTable fetched with asyncio.
+
+    Instances are created with ``await AsyncTimeTable.create(...)`` and expose
+    the same attributes and methods as TimeTable, except that refresh() is a
+    coroutine using the client the timetable was created with.
+    """
+
+    def __init__(self, *args, **kwargs):
+        raise TypeError('use "await AsyncTimeTable.create(...)" to fetch an AsyncTimeTable')
+
+    @classmethod
+    async def create(cls, school_name: str, local_code: int = 0, school_code: int = 0, week_num: int = 0,
+                     client: Optional[AsyncComciganClient] = None, lazy: bool = False) -> 'AsyncTimeTable':
+        """
+        Fetch the timetable of a school.
+
+        Args:
+            school_name (str): Name of the school
+            local_code (int, optional): Education office code
+            school_code (int, optional): School code
+            week_num (int): Week number (0 for current week, 1 for next week)
+            client (AsyncComciganClient, optional): Client used for the requests (default: per-loop client)
+            lazy (bool): Decode each day of the timetable on first access instead of all at once
+
+        Returns:
+            AsyncTimeTable: The fetched timetable
+
+        Raises:
+            ValueError: If week_num is not 0 or 1, or if codes are not integers
+            RuntimeError: If multiple schools found or school not found
+        """
+        cls._validate_inputs(week_num, local_code, school_code)
+        observer = current_observer()
+        start = time.perf_counter() if observer is not None else 0.0
+        client = client or get_default_async_client()
+
+        search_results, comcigan_codes = await client.call_with_codes(
+            lambda codes: _search(client, codes[0], school_name)
+        )
+        resolved = cls._select_school(search_results, local_code, school_code)
+        timetable, _ = await client.call_with_codes(
+            lambda codes: cls._load_async(client, resolved, week_num, codes, lazy), comcigan_codes
+        )
+
+        if observer is not None:
+            emit(observer, TOTAL, start)
+        return timetable
+
+    @classmethod
+    async def _load_async(cls, client: AsyncComciganClient, resolved: Tuple[int, str, int], week_num: int,
+                          comcigan_codes: ComciganCodes, lazy: bool = False) -> 'AsyncTimeTable':
+        """Fetch timetable data with the given service codes and build the instance from it."""
+        local_code, school_name, school_code = resolved
+        data = await cls._fetch_data_async(client, school_code, week_num, comcigan_codes)
+        return cls._from_data(data, local_code, school_name, school_code, comcigan_codes, client=client, lazy=lazy,
+                              week_num=week_num)
+
+    @classmethod
+    async def _fetch_data_async(cls, client: AsyncComciganClient, school_code: int, week_num: int,
+                                comcigan_codes: ComciganCodes) -> dict:
+        """Fetch and parse the timetable data of a school."""
+        body = await client._get_timed(cls._timetable_path(school_code, week_num, comcigan_codes), TIMETABLE_DOWNLOAD)
+
+        observer = current_observer()
+        start = time.perf_counter() if observer is not None else 0.0
+        data = cls._parse_timetable_response(body)
+        if observer is not None:
+            emit(observer, JSON_PARSE, start, len(body))
+        return data
+
+    async def refresh(self) -> List[Change]:
+        """
+        Fetch the timetable again and apply the changes in place, like TimeTable.refresh().
+
+        Uses the AsyncComciganClient the timetable was created (or loaded) with,
+        otherwise the per-loop client.
+
+        Returns:
+            List[Change]: Changed periods (empty if nothing changed)
+        """
+        client = self._client if isinstance(self._client, AsyncComciganClient) else get_default_async_client()
+
+        async def fetch(codes: ComciganCodes) -> Tuple[dict, str]:
+            data = await self._fetch_data_async(client, self.school_code, self._week_num, codes)
+            return data, data["자료" + codes[4]]
+
+        (data, update_date), comcigan_codes = await client.call_with_codes(fetch)
+        if update_date == self.update_date:
+            return []
+        return self._update_from_data(data, comcigan_codes)
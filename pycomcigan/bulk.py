@@ -0,0 +1,152 @@
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterable, Iterator, Optional, Tuple
+
+from .client import ComciganClient, get_default_client
+from .directory import SchoolDirectory
+from .instrumentation import TOTAL, current_observer, emit
+from .timetable import TimeTable
+
+SchoolSpec = Tuple[str, int, int]
+
+
+class RateLimiter:
+    """Thread-safe token bucket limiting the number of requests per second."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate (float): Allowed requests per second
+            burst (int): Number of requests that may be sent back to back
+        """
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class FetchResult:
+    """Outcome of fetching the timetable of a single school in fetch_many()."""
+
+    def __init__(self, school: SchoolSpec, timetable: Optional[TimeTable] = None,
+                 error: Optional[Exception] = None):
+        self.school = school
+        self.timetable = timetable
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __str__(self) -> str:
+        status = 'ok' if self.ok else f'error: {self.error!r}'
+        return f"{self.school[0]}: {status}"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+class _RateLimitedClient:
+    """Wraps a ComciganClient so every attempt, retries and hedges included, waits for the rate limiter."""
+
+    def __init__(self, client: ComciganClient, limiter: RateLimiter):
+        self._client = client
+        self._limiter = limiter
+        self.base_url = client.base_url
+
+    def get(self, path: str, encoding: str = 'UTF-8'):
+        return self._client._get(path, encoding, self._limiter.acquire)
+
+
+def fetch_many(schools: Iterable[SchoolSpec], week_num: int = 0, max_workers: int = 8,
+               rate_limit: Optional[float] = None, client: Optional[ComciganClient] = None,
+               lazy: bool = False, directory: Optional[SchoolDirectory] = None) -> Iterator[FetchResult]:
+    """
+    Fetch the timetables of many schools in parallel.
+
+    Results are yielded as soon as each school completes, so the order may
+    differ from the input. A failure only affects its own school and is
+    reported in FetchResult.error.
+
+    Args:
+        schools (Iterable[tuple]): (school_name, local_code, school_code) for every school
+        week_num (int): Week number (0 for current week, 1 for next week)
+        max_workers (int): Number of worker threads
+        rate_limit (float, optional): Maximum requests per second across all workers
+        client (ComciganClient, optional): Client used for the requests (default: module-wide client)
+        lazy (bool): Decode each day of the timetables on first access instead of all at once
+        directory (SchoolDirectory, optional): Local school directory used to skip search requests
+
+    Yields:
+        FetchResult: Timetable or error of each school
+
+    Raises:
+        ValueError: If week_num is not 0 or 1
+    """
+    TimeTable._validate_inputs(week_num, 0, 0)
+    client = client or get_default_client()
+    request_client = client
+    if rate_limit is not None:
+        request_client = _RateLimitedClient(client, RateLimiter(rate_limit))
+
+    # Fetch the service codes once up front; every school then uses the cached ones
+    TimeTable._get_comcigan_codes(request_client)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Run every school in a copy of the caller's context so instrument() observers follow it
+        futures = {
+            executor.submit(contextvars.copy_context().run, _fetch_school, school, week_num, request_client, client,
+                            lazy, directory): school
+            for school in schools
+        }
+        try:
+            for future in as_completed(futures):
+                school = futures[future]
+                try:
+                    yield FetchResult(school, timetable=future.result())
+                except Exception as error:
+                    yield FetchResult(school, error=error)
+        finally:
+            # Stop queued schools if the consumer abandons the generator
+            for future in futures:
+                future.cancel()
+
+
+def _fetch_school(school: SchoolSpec, week_num: int, request_client, client: ComciganClient, lazy: bool,
+                  directory: Optional[SchoolDirectory]) -> TimeTable:
+    """Resolve and fetch a single school, sending its requests through request_client."""
+    school_name, local_code, school_code = school
+    TimeTable._validate_inputs(week_num, local_code, school_code)
+    observer = current_observer()
+    start = time.perf_counter() if observer is not None else 0.0
+
+    # Like TimeTable(), except that refresh() later uses the client itself rather than the rate-limited wrapper
+    timetable = TimeTable.__new__(TimeTable)
+    timetable._client = client
+    timetable._lazy = lazy
+    timetable._week_num = week_num
+    timetable._load(school_name, local_code, school_code, directory, request_client)
+
+    if observer is not None:
+        emit(observer, TOTAL, start)
+    return timetable
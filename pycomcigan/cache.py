@@ -0,0 +1,251 @@
+import contextvars
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
+
+from .client import ComciganClient, get_default_client
+from .directory import SchoolDirectory, normalize_name
+from .instrumentation import TIMETABLE_CACHE, current_observer, emit
+from .timetable import TimeTable
+
+CacheKey = Tuple[int, int]
+
+# Timezone of the Comcigan server's weeks (Asia/Seoul, no daylight saving time)
+KST = timezone(timedelta(hours=9), 'KST')
+
+
+class _Entry:
+    """A cached timetable and its deadlines."""
+
+    __slots__ = ('timetable', 'fresh_until', 'stale_until', 'rollover_at')
+
+    def __init__(self, timetable: TimeTable, fresh_until: float, stale_until: float, rollover_at: Optional[float]):
+        self.timetable = timetable
+        self.fresh_until = fresh_until  # time.monotonic() until which it is served as is
+        self.stale_until = stale_until  # time.monotonic() until which it is served while refreshing
+        self.rollover_at = rollover_at  # time.time() at which its week is over
+
+
+class TimeTableCache:
+    """
+    Thread-safe LRU cache of timetables keyed by (school_code, week_num).
+
+    Fresh entries are served as is. Entries past their TTL are still served
+    while a background worker fetches them again (stale-while-revalidate).
+    Concurrent misses for the same school share a single upstream fetch, and
+    an entry is never served once the week of its start_date is over.
+
+        cache = TimeTableCache(maxsize=500, ttl=300)
+        timetable = cache.get("경기북과학고")
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0, max_stale: float = 3600.0,
+                 client: Optional[ComciganClient] = None, lazy: bool = False,
+                 directory: Optional[SchoolDirectory] = None, max_workers: int = 4):
+        """
+        Args:
+            maxsize (int): Maximum number of cached timetables
+            ttl (float): Seconds a fetched timetable is served without refreshing
+            max_stale (float): Seconds past the TTL a timetable is still served while it is refreshed
+            client (ComciganClient, optional): Client used for the requests (default: module-wide client)
+            lazy (bool): Decode each day of the timetables on first access instead of all at once
+            directory (SchoolDirectory, optional): Directory used to resolve school names (default: a new one)
+            max_workers (int): Number of background refresh threads
+        """
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.errors = 0
+        self._client = client
+        self._lazy = lazy
+        self._directory = directory if directory is not None else SchoolDirectory()
+        self._entries: 'OrderedDict[CacheKey, _Entry]' = OrderedDict()
+        self._inflight: Dict[CacheKey, Future] = {}
+        self._resolving: Dict[Tuple[str, int, int], Future] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pycomcigan-cache')
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, school_name: str, local_code: int = 0, school_code: int = 0, week_num: int = 0) -> TimeTable:
+        """
+        Get the timetable of a school, fetching it only when no usable entry is cached.
+
+        Cached timetables are shared between callers and must not be modified.
+
+        Args:
+            school_name (str): Name of the school
+            local_code (int, optional): Education office code
+            school_code (int, optional): School code
+            week_num (int): Week number (0 for current week, 1 for next week)
+
+        Returns:
+            TimeTable: The cached or fetched timetable
+
+        Raises:
+            ValueError: If week_num is not 0 or 1, or if codes are not integers
+            RuntimeError: If multiple schools found or school not found
+        """
+        TimeTable._validate_inputs(week_num, local_code, school_code)
+        observer = current_observer()
+        start = time.perf_counter() if observer is not None else 0.0
+
+        resolved = self._resolve(school_name, local_code, school_code)
+        key = (resolved[2], week_num)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._usable(entry):
+                self._entries.move_to_end(key)
+                if time.monotonic() < entry.fresh_until:
+                    self.hits += 1
+                else:
+                    self.stale_hits += 1
+                    if key not in self._inflight:
+                        future = Future()
+                        try:
+                            # The worker can only complete the refresh once the lock is released
+                            self._executor.submit(contextvars.copy_context().run, self._fetch, key, resolved, future)
+                        except RuntimeError:
+                            # Closed - keep serving the stale entry without refreshing it
+                            pass
+                        else:
+                            self.refreshes += 1
+                            self._inflight[key] = future
+                if observer is not None:
+                    emit(observer, TIMETABLE_CACHE, start, cache_hit=True)
+                return entry.timetable
+
+            self.misses += 1
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+
+        if owner:
+            self._fetch(key, resolved, future)
+        timetable = future.result()
+        if observer is not None:
+            emit(observer, TIMETABLE_CACHE, start, cache_hit=False)
+        return timetable
+
+    def _resolve(self, school_name: str, local_code: int, school_code: int) -> Tuple[int, str, int]:
+        """Resolve the school from the directory, searching only for schools it doesn't know yet."""
+        resolved = self._directory.resolve(school_name, local_code, school_code)
+        if resolved is not None:
+            return resolved
+
+        # Concurrent lookups of the same unknown school share one search request
+        key = (normalize_name(school_name), local_code, school_code)
+        with self._lock:
+            future = self._resolving.get(key)
+            owner = future is None
+            if owner:
+                future = self._resolving[key] = Future()
+
+        if owner:
+            try:
+                client = self._client or get_default_client()
+                resolved, _ = TimeTable._resolve_with_codes(school_name, local_code, school_code, client,
+                                                            self._directory)
+                future.set_result(resolved)
+            except Exception as error:
+                future.set_exception(error)
+            finally:
+                with self._lock:
+                    del self._resolving[key]
+        return future.result()
+
+    def _usable(self, entry: _Entry) -> bool:
+        """Whether an entry may be served, fresh or stale."""
+        if entry.rollover_at is not None and time.time() >= entry.rollover_at:
+            return False
+        return time.monotonic() < entry.stale_until
+
+    def _fetch(self, key: CacheKey, resolved: Tuple[int, str, int], future: Future) -> None:
+        """Fetch a timetable, store it and complete the future waited on by coalesced callers."""
+        local_code, school_name, school_code = resolved
+        try:
+            # The directory knows the school by now, so this skips the search request
+            timetable = TimeTable(school_name, local_code, school_code, key[1], client=self._client, lazy=self._lazy,
+                                  directory=self._directory)
+        except Exception as error:
+            with self._lock:
+                self.errors += 1
+                del self._inflight[key]
+            future.set_exception(error)
+            return
+
+        now = time.monotonic()
+        entry = _Entry(timetable, now + self.ttl, now + self.ttl + self.max_stale,
+                       self._rollover_at(timetable.start_date, key[1]))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            del self._inflight[key]
+        future.set_result(timetable)
+
+    @staticmethod
+    def _rollover_at(start_date: str, week_num: int) -> Optional[float]:
+        """
+        Time at which a timetable stops describing its week.
+
+        That is midnight KST of the Monday after the week of start_date for the
+        current week, and of start_date itself for next week. None when start_date can't be
+        parsed or the week was already over when fetched (the server not
+        having rolled over yet), in which case only the TTL applies.
+        """
+        try:
+            monday = date.fromisoformat(start_date)
+        except (TypeError, ValueError):
+            return None
+
+        rollover_day = monday + timedelta(days=7 * (1 - week_num))
+        rollover_at = datetime(rollover_day.year, rollover_day.month, rollover_day.day, tzinfo=KST).timestamp()
+        return rollover_at if rollover_at > time.time() else None
+
+    def invalidate(self, school_code: Optional[int] = None, week_num: Optional[int] = None) -> None:
+        """
+        Drop cached timetables so the next get() fetches them again.
+
+        Args:
+            school_code (int, optional): Only drop this school (default: every school)
+            week_num (int, optional): Only drop this week (default: both weeks)
+        """
+        with self._lock:
+            for key in list(self._entries):
+                if (school_code is None or key[0] == school_code) and (week_num is None or key[1] == week_num):
+                    del self._entries[key]
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and the number of cached timetables."""
+        return {'hits': self.hits, 'stale_hits': self.stale_hits, 'misses': self.misses,
+                'refreshes': self.refreshes, 'errors': self.errors, 'size': len(self._entries)}
+
+    def close(self) -> None:
+        """
+        Wait for background refreshes and stop the worker threads.
+
+        The cache can still be used afterwards, but stale entries are no longer
+        refreshed in the background.
+        """
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> 'TimeTableCache':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
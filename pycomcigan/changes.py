@@ -0,0 +1,151 @@
+from typing import TYPE_CHECKING, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from .grid import PeriodGrid
+
+if TYPE_CHECKING:
+    from .timetable import TimeTable
+
+# Kinds of changes reported by diff()
+REPLACED = 'replaced'  # A new replacement lecture
+REVERTED = 'reverted'  # A replacement went back to the original lecture
+TEACHER_CHANGED = 'teacher_changed'  # Same subject, different teacher
+CHANGED = 'changed'  # Any other change of the lecture or of the original timetable
+
+
+class Change(NamedTuple):
+    """A single changed period between two versions of a timetable."""
+    kind: str
+    grade: int
+    cls: int
+    day: int
+    period: int
+    before_subject: str
+    before_teacher: str
+    after_subject: str
+    after_teacher: str
+    replaced: bool
+
+
+def diff(old: 'TimeTable', new: 'TimeTable') -> List[Change]:
+    """
+    Get the periods that changed between two timetables of the same school.
+
+    Timetables with the same update timestamp are treated as identical and
+    are not compared at all.
+
+    Args:
+        old (TimeTable): Previous timetable
+        new (TimeTable): Newer timetable
+
+    Returns:
+        List[Change]: Changed periods sorted by grade, class, day and period
+    """
+    if old.school_code == new.school_code and old.update_date == new.update_date:
+        return []
+    return diff_grids(old._grid, new._grid)
+
+
+def diff_grids(old: PeriodGrid, new: PeriodGrid) -> List[Change]:
+    """Compare the packed period codes of two timetables."""
+    same_tables = old.subjects == new.subjects and old.teachers == new.teachers
+
+    if same_tables and same_shape(old, new):
+        # Only positions whose codes differ can have changed
+        positions = _changed_positions(old, new)
+    else:
+        positions = _all_positions(old, new)
+
+    changes = []
+    for grade, cls, day, period in positions:
+        change = _compare_period(old, new, grade, cls, day, period)
+        if change is not None:
+            changes.append(change)
+    return changes
+
+
+def same_shape(old: PeriodGrid, new: PeriodGrid) -> bool:
+    """Whether two grids have the same axes, classes and days, so their packed arrays line up."""
+    return ((old.grades, old.classes, old.days, old.periods) == (new.grades, new.classes, new.days, new.periods) and
+            old.class_counts == new.class_counts and old.day_counts == new.day_counts)
+
+
+def _changed_positions(old: PeriodGrid, new: PeriodGrid) -> Iterable[Tuple[int, int, int, int]]:
+    """Positions of differing codes in two grids of the same shape."""
+    indexes = set()
+    for old_codes, new_codes in ((old.current, new.current), (old.original, new.original)):
+        indexes.update(i for i, (a, b) in enumerate(zip(old_codes, new_codes)) if a != b)
+
+    positions = []
+    for i in sorted(indexes):
+        rest, period = divmod(i, old.periods)
+        rest, day = divmod(rest, old.days)
+        grade, cls = divmod(rest, old.classes)
+        # Slot 0 holds the period count, not a lecture (see resized_days())
+        if period != 0:
+            positions.append((grade, cls, day, period))
+    return positions
+
+
+def resized_days(old: PeriodGrid, new: PeriodGrid) -> Set[Tuple[int, int, int]]:
+    """(grade, class, day) whose period count (slot 0) differs between two grids of the same shape."""
+    days = set()
+    for old_codes, new_codes in ((old.current, new.current), (old.original, new.original)):
+        for i in range(0, len(old_codes), old.periods):
+            if old_codes[i] != new_codes[i]:
+                rest, day = divmod(i // old.periods, old.days)
+                days.add((*divmod(rest, old.classes), day))
+    return days
+
+
+def _all_positions(old: PeriodGrid, new: PeriodGrid) -> Iterable[Tuple[int, int, int, int]]:
+    """Every position present in either grid."""
+    for grade in range(1, max(old.grades, new.grades)):
+        for cls in range(1, max(_class_count(old, grade), _class_count(new, grade))):
+            for day in range(1, max(_day_count(old, grade, cls), _day_count(new, grade, cls)) + 1):
+                for period in range(1, max(old.periods, new.periods)):
+                    yield grade, cls, day, period
+
+
+def _class_count(grid: PeriodGrid, grade: int) -> int:
+    return grid.class_count(grade) if grade < grid.grades else 0
+
+
+def _day_count(grid: PeriodGrid, grade: int, cls: int) -> int:
+    return grid.day_count(grade, cls) if cls < _class_count(grid, grade) else 0
+
+
+def _codes_at(grid: PeriodGrid, grade: int, cls: int, day: int, period: int) -> Tuple[int, int]:
+    """(current, original) codes of a period, or (0, 0) outside the grid."""
+    if cls >= _class_count(grid, grade) or day >= grid.days or period >= grid.periods:
+        return 0, 0
+    offset = grid.offset(grade, cls, day) + period
+    return grid.current[offset], grid.original[offset]
+
+
+def _names(grid: PeriodGrid, code: int) -> Tuple[str, str]:
+    return (grid.subject(code), grid.teacher(code)) if code != 0 else ("", "")
+
+
+def _compare_period(old: PeriodGrid, new: PeriodGrid, grade: int, cls: int, day: int,
+                    period: int) -> Optional[Change]:
+    old_current, old_original = _codes_at(old, grade, cls, day, period)
+    new_current, new_original = _codes_at(new, grade, cls, day, period)
+
+    before = _names(old, old_current)
+    after = _names(new, new_current)
+    was_replaced = old_current != old_original
+    is_replaced = new_current != new_original
+
+    if before == after and _names(old, old_original) == _names(new, new_original):
+        return None
+
+    if is_replaced and not was_replaced:
+        kind = REPLACED
+    elif was_replaced and not is_replaced:
+        kind = REVERTED
+    elif before[0] == after[0] and before[1] != after[1]:
+        kind = TEACHER_CHANGED
+    else:
+        kind = CHANGED
+
+    return Change(kind, grade, cls, day, period, before[0], before[1], after[0], after[1], is_replaced)
@@ -0,0 +1,121 @@
+import threading
+from typing import Callable, Dict, Optional
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+from .policy import RequestPolicy, Timeout
+
+# Constants for Comcigan API
+COMCIGAN_URL = 'http://comci.net:4082'
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/106.0.0.0 Safari/537.36'
+}
+
+
+class ComciganClient:
+    """
+    HTTP client owning a pooled keep-alive session to the Comcigan server.
+
+    Reusing one client across searches and timetable requests keeps the TCP
+    connection to comci.net:4082 open instead of reconnecting on every call.
+    Every request goes through the client's RequestPolicy (timeouts, retries,
+    hedging and circuit breaking).
+    """
+
+    def __init__(self, base_url: str = COMCIGAN_URL, pool_connections: int = 1, pool_maxsize: int = 10,
+                 timeout: Timeout = None, headers: Optional[Dict[str, str]] = None,
+                 adapter: Optional[BaseAdapter] = None, policy: Optional[RequestPolicy] = None):
+        """
+        Args:
+            base_url (str): Comcigan server URL
+            pool_connections (int): Number of host pools to keep
+            pool_maxsize (int): Maximum number of kept-alive connections per host
+            timeout (float | tuple, optional): requests timeout, either seconds or (connect, read)
+                (default: the policy's timeout)
+            headers (dict, optional): Extra headers sent with every request
+            adapter (BaseAdapter, optional): Transport adapter to mount instead of the default HTTPAdapter
+            policy (RequestPolicy, optional): Timeouts, retries, hedging and circuit breaking
+                (default: RequestPolicy())
+        """
+        self.base_url = base_url.rstrip('/')
+        self.policy = policy or RequestPolicy()
+        self.timeout = timeout if timeout is not None else self.policy.timeout
+
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        if headers:
+            self.session.headers.update(headers)
+
+        if adapter is None:
+            adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.mount('http://', adapter)
+        self.mount('https://', adapter)
+
+    def mount(self, prefix: str, adapter: BaseAdapter) -> None:
+        """Mount a transport adapter on the underlying session."""
+        self.session.mount(prefix, adapter)
+
+    def get(self, path: str, encoding: str = 'UTF-8') -> requests.Response:
+        """
+        Send a GET request for a path on the Comcigan server.
+
+        Args:
+            path (str): Path (and query) appended to base_url
+            encoding (str): Encoding used to decode the response text
+
+        Returns:
+            requests.Response: The response with its encoding set
+
+        Raises:
+            CircuitOpenError: If the policy's circuit breaker is open
+            requests.RequestException: If the request failed after all retries
+        """
+        return self._get(path, encoding)
+
+    def _get(self, path: str, encoding: str = 'UTF-8',
+             before_send: Optional[Callable[[], None]] = None) -> requests.Response:
+        """Send a GET request, calling before_send ahead of every attempt including retries and hedges."""
+        url = self.base_url + path
+
+        def send(timeout: Timeout) -> requests.Response:
+            if before_send is not None:
+                before_send()
+            return self.session.get(url, timeout=timeout)
+
+        response = self.policy.execute(send, self.timeout)
+        response.encoding = encoding
+        return response
+
+    def close(self) -> None:
+        """Close the session and its pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> 'ComciganClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+_default_client: Optional[ComciganClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> ComciganClient:
+    """Return the module-wide client, creating it on first use."""
+    global _default_client
+
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = ComciganClient()
+    return _default_client
+
+
+def set_default_client(client: Optional[ComciganClient]) -> None:
+    """Replace the module-wide client. Passing None recreates it lazily on next use."""
+    global _default_client
+
+    with _default_client_lock:
+        _default_client = client
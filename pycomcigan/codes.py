@@ -0,0 +1,174 @@
+import re
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple, TypeVar
+
+from .client import ComciganClient, get_default_client
+from .instrumentation import CODE_CACHE, CODE_PARSE, ST_DOWNLOAD, current_observer, emit
+
+# Default lifetime of the scraped service codes, in seconds
+DEFAULT_CODE_TTL = 600.0
+
+ComciganCodes = Tuple[str, str, str, str, str, str, str]
+
+T = TypeVar('T')
+
+# Raised when parsing a response requested with stale service codes (the server answers with a page that isn't JSON)
+STALE_CODE_ERRORS = (ValueError, KeyError)
+
+# Pattern and substring of every service code in the /st page (see comcigan.md)
+CODE_PATTERNS = {
+    'comcigan_code': ('\\.\\/[0-9]+\\?[0-9]+l', slice(1, None)),
+    'code0': ("sc_data\\(\'[0-9]+_", slice(9, -1)),
+    'code1': ('성명=자료.자료[0-9]+', slice(8, None)),
+    'code2': ('자료.자료[0-9]+\\[sb\\]', slice(5, -4)),
+    'code3': ('=H시간표.자료[0-9]+', slice(8, None)),
+    'code4': ('일일자료=Q자료\\(자료\\.자료[0-9]+', slice(14, None)),
+    'code5': ('원자료=Q자료\\(자료\\.자료[0-9]+', slice(13, None)),
+}
+
+# Every pattern starts with a literal, which lets re skip ahead to it. A single
+# combined alternation loses that and is slower on the ~100 KB page.
+_CODE_RES = [(name, re.compile(pattern), part) for name, (pattern, part) in CODE_PATTERNS.items()]
+
+
+def parse_comcigan_codes(content: str) -> ComciganCodes:
+    """
+    Extract all service codes from the decoded /st page.
+
+    Each scan stops at the first match instead of collecting every match in the page.
+
+    Args:
+        content (str): EUC-KR decoded body of the /st page
+
+    Returns:
+        ComciganCodes: (comcigan_code, code0, code1, code2, code3, code4, code5)
+
+    Raises:
+        IndexError: If a code is missing from the page
+    """
+    codes = []
+    for name, pattern, part in _CODE_RES:
+        match = pattern.search(content)
+        if match is None:
+            raise IndexError(f'{name} not found in the /st page')
+        codes.append(match.group()[part])
+
+    return tuple(codes)
+
+
+def fetch_comcigan_codes(client: Optional[ComciganClient] = None) -> ComciganCodes:
+    """Download the /st page and extract all service codes from it."""
+    client = client or get_default_client()
+    observer = current_observer()
+    if observer is None:
+        return parse_comcigan_codes(client.get('/st', encoding='euc-kr').text)
+
+    start = time.perf_counter()
+    response = client.get('/st', encoding='euc-kr')
+    content = response.text
+    emit(observer, ST_DOWNLOAD, start, len(response.content))
+
+    start = time.perf_counter()
+    codes = parse_comcigan_codes(content)
+    emit(observer, CODE_PARSE, start, len(response.content))
+    return codes
+
+
+class CodeCache:
+    """
+    Thread-safe TTL cache for the Comcigan service codes.
+
+    The codes scraped from /st change rarely, so a single fetch is shared by
+    every search and timetable request until it expires or is invalidated.
+    Codes are kept per server URL so clients pointed at different servers
+    don't share them.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_CODE_TTL):
+        """
+        Args:
+            ttl (float): Seconds a fetched set of codes stays valid
+        """
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Tuple[ComciganCodes, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, client: Optional[ComciganClient] = None) -> ComciganCodes:
+        """
+        Return the cached codes, fetching them again if they have expired.
+
+        Args:
+            client (ComciganClient, optional): Client used for the fetch (default: module-wide client)
+
+        Returns:
+            ComciganCodes: (comcigan_code, code0, code1, code2, code3, code4, code5)
+        """
+        client = client or get_default_client()
+        observer = current_observer()
+        start = time.perf_counter() if observer is not None else 0.0
+
+        with self._lock:
+            entry = self._entries.get(client.base_url)
+            if entry is not None and time.monotonic() < entry[1]:
+                self.hits += 1
+                if observer is not None:
+                    emit(observer, CODE_CACHE, start, cache_hit=True)
+                return entry[0]
+
+            self.misses += 1
+            codes = fetch_comcigan_codes(client)
+            self._entries[client.base_url] = (codes, time.monotonic() + self.ttl)
+            if observer is not None:
+                emit(observer, CODE_CACHE, start, cache_hit=False)
+            return codes
+
+    def call_with_codes(self, client: Optional[ComciganClient], func: Callable[[ComciganCodes], T],
+                        codes: Optional[ComciganCodes] = None) -> Tuple[T, ComciganCodes]:
+        """
+        Call func with the service codes, refetching them and retrying once if they have rotated.
+
+        Args:
+            client (ComciganClient, optional): Client used to fetch the codes (default: module-wide client)
+            func (Callable): Sends and parses requests with the given codes
+            codes (ComciganCodes, optional): Codes to try first (default: the cached ones)
+
+        Returns:
+            Tuple: The result of func and the codes it succeeded with
+        """
+        codes = codes if codes is not None else self.get(client)
+        try:
+            return func(codes), codes
+        except STALE_CODE_ERRORS:
+            # The service codes have most likely rotated - refetch them and retry once
+            self.invalidate(codes)
+            codes = self.get(client)
+            return func(codes), codes
+
+    def invalidate(self, codes: Optional[ComciganCodes] = None) -> None:
+        """
+        Drop the cached codes so the next get() refetches them.
+
+        Args:
+            codes (ComciganCodes, optional): Only invalidate entries holding these
+                codes. Prevents a slow failing request from throwing away codes
+                another thread has already refreshed.
+        """
+        with self._lock:
+            if codes is None:
+                self._entries.clear()
+                return
+
+            for base_url, (cached_codes, _) in list(self._entries.items()):
+                if cached_codes == codes:
+                    del self._entries[base_url]
+
+    def stats(self) -> dict:
+        """Return hit/miss counters."""
+        return {'hits': self.hits, 'misses': self.misses}
+
+
+# Process-wide cache shared by search_school and timetable
+code_cache = CodeCache()
@@ -0,0 +1,140 @@
+from typing import List, NamedTuple
+
+from .grid import PeriodGrid
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - optional dependency
+    pd = None
+
+# Long format columns of to_dataframe()
+DATAFRAME_COLUMNS = ['grade', 'cls', 'day', 'period', 'subject_code', 'teacher_code', 'subject', 'teacher',
+                     'replaced', 'original_subject_code', 'original_teacher_code', 'original_subject',
+                     'original_teacher']
+
+
+class TimeTableArrays(NamedTuple):
+    """
+    Current and original timetables of a school as NumPy arrays.
+
+    ``current`` and ``original`` are shaped (grade, class, day, period) and
+    hold the raw period codes (subject * 1000 + teacher, 0 for no class).
+    Like the timetable, index 0 of the grade, class and day axes is empty and
+    ``[grade, cls, day, period]`` is the period with that number.
+    """
+    current: 'np.ndarray'
+    original: 'np.ndarray'
+    period_counts: 'np.ndarray'  # (grade, class, day) number of periods of each day
+    subjects: List[str]
+    teachers: List[str]
+
+    @property
+    def current_subject(self) -> 'np.ndarray':
+        """Subject indices of the current timetable."""
+        return self.current // 1000
+
+    @property
+    def current_teacher(self) -> 'np.ndarray':
+        """Teacher indices of the current timetable."""
+        return self.current % 100
+
+    @property
+    def original_subject(self) -> 'np.ndarray':
+        """Subject indices of the original timetable."""
+        return self.original // 1000
+
+    @property
+    def original_teacher(self) -> 'np.ndarray':
+        """Teacher indices of the original timetable."""
+        return self.original % 100
+
+    @property
+    def replaced(self) -> 'np.ndarray':
+        """Boolean mask of the replaced periods."""
+        return self.current != self.original
+
+
+def to_arrays(grid: PeriodGrid) -> TimeTableArrays:
+    """
+    Export packed period codes as NumPy arrays without decoding any period.
+
+    Args:
+        grid (PeriodGrid): Packed period codes of the school
+
+    Returns:
+        TimeTableArrays: Current/original codes, period counts and name tables
+
+    Raises:
+        RuntimeError: If numpy is not installed
+    """
+    if np is None:
+        raise RuntimeError('numpy is not installed')
+
+    shape = (grid.grades, grid.classes, grid.days, grid.periods)
+    current = np.frombuffer(grid.current, dtype=np.intc).reshape(shape).copy()
+    original = np.frombuffer(grid.original, dtype=np.intc).reshape(shape).copy()
+
+    # Slot 0 holds the period count of the day, not a period
+    period_counts = original[..., 0].copy()
+    current[..., 0] = 0
+    original[..., 0] = 0
+
+    return TimeTableArrays(current, original, period_counts, list(grid.subjects), list(grid.teachers))
+
+
+def _names(table: List[str], indices: 'np.ndarray') -> 'np.ndarray':
+    """Look up names by index, with "" for indices outside the table (like PeriodGrid)."""
+    size = max(len(table), int(indices.max(initial=0)) + 1)
+    names = np.array(list(table) + [""] * (size - len(table)), dtype=object)
+    return names[indices]
+
+
+def to_dataframe(grid: PeriodGrid) -> 'pd.DataFrame':
+    """
+    Export packed period codes as a long format DataFrame.
+
+    Has one row for every period with a current or original class, with the
+    columns in DATAFRAME_COLUMNS.
+
+    Args:
+        grid (PeriodGrid): Packed period codes of the school
+
+    Returns:
+        pandas.DataFrame: The periods of every class
+
+    Raises:
+        RuntimeError: If numpy or pandas is not installed
+    """
+    if pd is None:
+        raise RuntimeError('pandas is not installed')
+
+    arrays = to_arrays(grid)
+    grade, cls, day, period = np.nonzero((arrays.current != 0) | (arrays.original != 0))
+    current = arrays.current[grade, cls, day, period]
+    original = arrays.original[grade, cls, day, period]
+
+    subject_code = current // 1000
+    teacher_code = current % 100
+    original_subject_code = original // 1000
+    original_teacher_code = original % 100
+
+    return pd.DataFrame({
+        'grade': grade,
+        'cls': cls,
+        'day': day,
+        'period': period,
+        'subject_code': subject_code,
+        'teacher_code': teacher_code,
+        'subject': _names(arrays.subjects, subject_code),
+        'teacher': _names(arrays.teachers, teacher_code),
+        'replaced': current != original,
+        'original_subject_code': original_subject_code,
+        'original_teacher_code': original_teacher_code,
+        'original_subject': _names(arrays.subjects, original_subject_code),
+        'original_teacher': _names(arrays.teachers, original_teacher_code),
+    }, columns=DATAFRAME_COLUMNS)
@@ -0,0 +1,187 @@
+import bisect
+import json
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+SchoolKey = Tuple[int, int]
+
+# Long school type suffixes and their common abbreviations, longest first
+_SUFFIXES = (
+    ('여자고등학교', '여고'),
+    ('여자중학교', '여중'),
+    ('고등학교', '고'),
+    ('중학교', '중'),
+    ('초등학교', '초'),
+)
+
+
+def strip_name(name: str) -> str:
+    """Remove whitespace from a school name and lowercase it, keeping its suffix as is."""
+    return ''.join(name.split()).lower()
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a school name so full and abbreviated names compare equal.
+
+    "경기북과학고등학교" and "경기북과학고" both normalize to "경기북과학고".
+    """
+    normalized = strip_name(name)
+    for suffix, abbreviation in _SUFFIXES:
+        if normalized.endswith(suffix):
+            return normalized[:-len(suffix)] + abbreviation
+    return normalized
+
+
+class SchoolDirectory:
+    """
+    Local index of schools seen in search results.
+
+    Supports exact lookups on normalized names, prefix and substring lookups
+    on both the full and the abbreviated names, and lookups by
+    (local_code, school_code), without any network access.
+    """
+
+    def __init__(self, schools: Iterable[List] = ()):
+        """
+        Args:
+            schools (Iterable[List]): Search results [[local_code, local_name, school_name, school_code], ...]
+        """
+        self._schools: Dict[SchoolKey, List] = {}
+        self._by_code: Dict[int, List[SchoolKey]] = {}
+        self._by_name: Dict[str, List[SchoolKey]] = {}
+        # Full and abbreviated names, so partly typed full names still match
+        self._by_form: Dict[str, List[SchoolKey]] = {}
+        self._sorted_names: List[str] = []
+        self._bigrams: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self.add(schools)
+
+    def __len__(self) -> int:
+        return len(self._schools)
+
+    def __contains__(self, key: SchoolKey) -> bool:
+        return key in self._schools
+
+    def add(self, schools: Iterable[List]) -> None:
+        """
+        Add schools from search results, ignoring ones already known.
+
+        Args:
+            schools (Iterable[List]): [[local_code, local_name, school_name, school_code], ...]
+        """
+        with self._lock:
+            for school in schools:
+                key = (school[0], school[3])
+                if key in self._schools:
+                    continue
+                self._schools[key] = list(school)
+                self._by_code.setdefault(school[3], []).append(key)
+
+                self._by_name.setdefault(normalize_name(school[2]), []).append(key)
+                for name in {strip_name(school[2]), normalize_name(school[2])}:
+                    if name not in self._by_form:
+                        self._by_form[name] = []
+                        bisect.insort(self._sorted_names, name)
+                        for bigram in self._name_bigrams(name):
+                            self._bigrams.setdefault(bigram, set()).add(name)
+                    self._by_form[name].append(key)
+
+    @staticmethod
+    def _name_bigrams(name: str) -> Set[str]:
+        return {name[i:i + 2] for i in range(len(name) - 1)} or {name}
+
+    def get(self, local_code: int, school_code: int) -> Optional[List]:
+        """Get a school by its (local_code, school_code)."""
+        return self._schools.get((local_code, school_code))
+
+    def lookup(self, school_name: str) -> List[List]:
+        """Get the schools whose normalized name equals the normalized school_name."""
+        return [self._schools[key] for key in self._by_name.get(normalize_name(school_name), [])]
+
+    def _schools_of(self, names: Iterable[str], limit: Optional[int]) -> List[List]:
+        """Schools known by any of the names, once each, sorted by normalized name."""
+        keys = {key for name in names for key in self._by_form[name]}
+        schools = sorted((self._schools[key] for key in keys), key=lambda school: (normalize_name(school[2]), school))
+        return schools[:limit] if limit is not None else schools
+
+    def prefix(self, query: str, limit: Optional[int] = None) -> List[List]:
+        """
+        Get the schools whose full or abbreviated name starts with the query.
+
+        Args:
+            query (str): Beginning of a school name
+            limit (int, optional): Maximum number of schools to return
+
+        Returns:
+            List[List]: Schools sorted by normalized name
+        """
+        query = strip_name(query)
+        names = self._sorted_names
+        end = start = bisect.bisect_left(names, query)
+        while end < len(names) and names[end].startswith(query):
+            end += 1
+        return self._schools_of(names[start:end], limit)
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[List]:
+        """
+        Get the schools whose full or abbreviated name contains the query.
+
+        Args:
+            query (str): Part of a school name
+            limit (int, optional): Maximum number of schools to return
+
+        Returns:
+            List[List]: Schools sorted by normalized name
+        """
+        query = strip_name(query)
+        if len(query) < 2:
+            names = [name for name in self._sorted_names if query in name]
+        else:
+            candidates = None
+            for bigram in self._name_bigrams(query):
+                matches = self._bigrams.get(bigram, set())
+                candidates = matches if candidates is None else candidates & matches
+                if not candidates:
+                    return []
+            names = [name for name in candidates if query in name]
+
+        return self._schools_of(names, limit)
+
+    def resolve(self, school_name: str, local_code: int = 0, school_code: int = 0) -> Optional[Tuple[int, str, int]]:
+        """
+        Resolve a school without a search request, when the directory is sure of the answer.
+
+        A school is resolved when its codes are known, or when exactly one
+        known school has the same normalized name. A name that only partly
+        matches is never trusted, since the directory may not know every school.
+
+        Returns:
+            Tuple[int, str, int] | None: (local_code, school_name, school_code), or None if unsure
+        """
+        if school_code:
+            candidates = [self._schools[key] for key in self._by_code.get(school_code, [])]
+            if local_code:
+                candidates = [school for school in candidates if school[0] == local_code]
+        else:
+            candidates = self.lookup(school_name)
+            if local_code:
+                candidates = [school for school in candidates if school[0] == local_code]
+
+        if len(candidates) != 1:
+            return None
+        school = candidates[0]
+        return school[0], school[2], school[3]
+
+    def save(self, path: str) -> None:
+        """Persist the directory as JSON."""
+        with self._lock:
+            schools = list(self._schools.values())
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump({"학교검색": schools}, file, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str) -> 'SchoolDirectory':
+        """Load a directory saved with save()."""
+        with open(path, encoding='utf-8') as file:
+            return cls(json.load(file)["학교검색"])
@@ -0,0 +1,233 @@
+import base64
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib import parse
+
+# Service codes embedded in the generated /st page
+DEFAULT_CODES = {
+    'comcigan_code': './36179?17384l',
+    'code0': '73629',
+    'code1': '446',
+    'code2': '492',
+    'code3': '147',
+    'code4': '481',
+    'code5': '245',
+}
+
+DEFAULT_SCHOOLS = [
+    [24966, "경기", "경기북과학고등학교", 12045],
+    [24966, "경기", "경기과학고등학교", 12046],
+    [12345, "서울", "서울과학고등학교", 41234],
+]
+
+
+def make_st_page(codes: Dict[str, str]) -> str:
+    """Build a /st page containing every service code the client scrapes."""
+    return (
+        "<html><head><script>\n"
+        f"var url='{codes['comcigan_code']}';\n"
+        f"function sc_load(sc){{sc_data('{codes['code0']}_'+sc,0,1);}}\n"
+        f"function show(){{var 성명=자료.자료{codes['code1']}; var 과목=자료.자료{codes['code2']}[sb];\n"
+        f"var 갱신=H시간표.자료{codes['code3']};\n"
+        f"일일자료=Q자료(자료.자료{codes['code4']});\n"
+        f"원자료=Q자료(자료.자료{codes['code5']});}}\n"
+        "</script></head><body></body></html>"
+    )
+
+
+def make_timetable_payload(codes: Dict[str, str], school_name: str = "경기북과학고등학교", grades: int = 3,
+                           classes: int = 15, days: int = 5, periods: int = 8, teachers: int = 90,
+                           subjects: int = 60, replaced_ratio: float = 0.05, seed: int = 0,
+                           update_date: str = "2023-11-01 08:00:00") -> dict:
+    """
+    Generate a timetable response shaped like the real one.
+
+    Period codes are subject * 1000 + teacher, as decoded by TimeTable.
+    """
+    rng = random.Random(seed)
+    teachers = min(teachers, 99)
+
+    original = [[]]
+    current = [[]]
+    for _ in range(grades):
+        original_grade = [[]]
+        current_grade = [[]]
+        for _ in range(classes):
+            original_class = [days]
+            current_class = [days]
+            for _ in range(days):
+                period_count = rng.randint(periods - 2, periods)
+                codes_of_day = [rng.randint(1, subjects) * 1000 + rng.randint(1, teachers)
+                                for _ in range(period_count)]
+                replaced = [rng.randint(1, subjects) * 1000 + rng.randint(1, teachers)
+                            if rng.random() < replaced_ratio else code for code in codes_of_day]
+                original_class.append([period_count] + codes_of_day)
+                current_class.append([period_count] + replaced)
+            original_grade.append(original_class)
+            current_grade.append(current_class)
+        original.append(original_grade)
+        current.append(current_grade)
+
+    return {
+        "학교명": school_name,
+        "지역명": "경기",
+        "학년도": 2023,
+        "시작일": "2023-10-30",
+        "일과시간": [f"{period}({8 + period:02d}:00)" for period in range(1, periods + 1)],
+        "자료" + codes['code1']: [" *"] + [f"교사{idx}" for idx in range(1, teachers + 1)],
+        "자료" + codes['code2']: [""] + [f"과목{idx}" for idx in range(1, subjects + 1)],
+        "자료" + codes['code3']: update_date,
+        "자료" + codes['code4']: current,
+        "자료" + codes['code5']: original,
+        "학급수": [grades * classes] + [classes] * grades,
+        "담임": [[rng.randint(1, teachers) for _ in range(classes)] + [255] for _ in range(grades)],
+    }
+
+
+class FakeComciganServer:
+    """
+    Local stand-in for comci.net:4082, for offline tests and benchmarks.
+
+    Serves the /st page, school search and timetable endpoints in the formats
+    described in comcigan.md, with configurable latency and error injection.
+
+        with FakeComciganServer() as server:
+            timetable = TimeTable("경기북과학고", client=ComciganClient(server.url))
+    """
+
+    def __init__(self, schools: Optional[List[List]] = None, timetables: Optional[Dict[int, dict]] = None,
+                 codes: Optional[Dict[str, str]] = None, latency: float = 0.0, error_rate: float = 0.0,
+                 host: str = '127.0.0.1', port: int = 0, seed: int = 0, **payload_options):
+        """
+        Args:
+            schools (List[List], optional): Search results [[local_code, local_name, school_name, school_code], ...]
+            timetables (dict, optional): Recorded timetable payloads by school code, generated when missing
+            codes (dict, optional): Service codes (see DEFAULT_CODES)
+            latency (float): Seconds to wait before every response
+            error_rate (float): Probability of answering with HTTP 500
+            host (str): Address to bind
+            port (int): Port to bind (0 picks a free port)
+            seed (int): Seed of the error injection and generated payloads
+            **payload_options: Passed to make_timetable_payload() for generated payloads
+        """
+        self.schools = schools if schools is not None else list(DEFAULT_SCHOOLS)
+        self.timetables = dict(timetables or {})
+        self.codes = dict(codes or DEFAULT_CODES)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.seed = seed
+        self.payload_options = payload_options
+        self.requests: List[str] = []
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to pass to ComciganClient."""
+        host, port = self._httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> 'FakeComciganServer':
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> 'FakeComciganServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def fail_next(self, count: int = 1) -> None:
+        """Answer the next `count` requests with HTTP 500."""
+        with self._lock:
+            self._failures += count
+
+    def rotate_codes(self, codes: Dict[str, str]) -> None:
+        """Switch to new service codes, like the real server occasionally does."""
+        self.codes = dict(codes)
+        self.timetables = {}
+
+    def timetable_payload(self, school_code: int) -> dict:
+        """Recorded (or generated and then remembered) payload of a school."""
+        with self._lock:
+            if school_code not in self.timetables:
+                school_name = next((school[2] for school in self.schools if school[3] == school_code), "")
+                self.timetables[school_code] = make_timetable_payload(
+                    self.codes, school_name=school_name, seed=self.seed + school_code, **self.payload_options
+                )
+            return self.timetables[school_code]
+
+    def _should_fail(self) -> bool:
+        with self._lock:
+            if self._failures > 0:
+                self._failures -= 1
+                return True
+            return self.error_rate > 0 and self._random.random() < self.error_rate
+
+    def _respond(self, path: str):
+        """Return (status, body) for a request path."""
+        self.requests.append(path)
+        if self.latency:
+            time.sleep(self.latency)
+        if self._should_fail():
+            return 500, b'Internal Server Error'
+
+        comcigan_code = self.codes['comcigan_code'][1:]
+        if path == '/st':
+            return 200, make_st_page(self.codes).encode('euc-kr')
+
+        if path.startswith(comcigan_code):
+            school_name = parse.unquote(path[len(comcigan_code):], encoding='euc-kr')
+            results = [school for school in self.schools if school_name and school_name in school[2]]
+            body = json.dumps({"학교검색": results}, ensure_ascii=False).encode('utf-8')
+            return 200, body + b'\0'
+
+        if path.startswith(comcigan_code[:7]):
+            try:
+                params = base64.b64decode(path[7:]).decode('utf-8').split('_')
+                code0, school_code, _, _ = params
+            except ValueError:
+                return 404, b'Not Found'
+            if code0 != self.codes['code0']:
+                # Stale service codes - the real server answers with something that isn't JSON
+                return 200, b'<html></html>'
+            payload = self.timetable_payload(int(school_code))
+            return 200, json.dumps(payload, ensure_ascii=False).encode('utf-8') + b'\n'
+
+        return 404, b'Not Found'
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body are written separately; avoid delayed-ACK stalls on keep-alive connections
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                status, body = server._respond(self.path)
+                self.send_response(status)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,216 @@
+from array import array
+from collections.abc import Sequence
+from typing import Callable, List, Optional
+
+# array typecode of the packed period codes (subject * 1000 + teacher fits in 32 bits)
+CODE_TYPECODE = 'i'
+
+
+class PeriodGrid:
+    """
+    Packed storage of the raw period codes of a whole school.
+
+    The current (``자료(code4)``) and original (``자료(code5)``) timetables are
+    stored as two flat typed arrays laid out as (grade, class, day, slot),
+    where slot 0 holds the number of periods of that day and slots 1.. hold
+    the period codes (subject = code // 1000, teacher = code % 100). Subject
+    and teacher names live once in shared tables.
+    """
+
+    __slots__ = ('grades', 'classes', 'days', 'periods', 'class_counts', 'day_counts',
+                 'current', 'original', 'subjects', 'teachers')
+
+    def __init__(self, grades: int, classes: int, days: int, periods: int, class_counts: Sequence,
+                 day_counts: Sequence, current: Sequence, original: Sequence, subjects: List[str],
+                 teachers: List[str]):
+        """
+        Args:
+            grades (int): Size of the grade axis (including the empty grade 0)
+            classes (int): Size of the class axis (including the empty class 0)
+            days (int): Size of the day axis (including the empty day 0)
+            periods (int): Size of the slot axis (period count + periods)
+            class_counts (Sequence): Number of classes of each grade, including class 0
+            day_counts (Sequence): Number of days of each (grade, class), flattened
+            current (Sequence): Packed current period codes
+            original (Sequence): Packed original period codes
+            subjects (List[str]): Subject names indexed by subject code
+            teachers (List[str]): Teacher names indexed by teacher code
+        """
+        self.grades = grades
+        self.classes = classes
+        self.days = days
+        self.periods = periods
+        self.class_counts = class_counts
+        self.day_counts = day_counts
+        self.current = current
+        self.original = original
+        self.subjects = subjects
+        self.teachers = teachers
+
+    @classmethod
+    def from_payload(cls, current_timetable: List, original_timetable: List, subjects: List[str],
+                     teachers: List[str]) -> 'PeriodGrid':
+        """Pack the nested ``자료(code4)``/``자료(code5)`` arrays of a timetable response."""
+        grades = len(current_timetable)
+        classes = max([len(grade_data) for grade_data in current_timetable] + [1])
+
+        days = 1
+        periods = 1
+        for grade_data in (current_timetable + original_timetable):
+            for class_data in grade_data[1:]:
+                if class_data:
+                    days = max(days, len(class_data), class_data[0] + 1)
+                for day_data in class_data[1:]:
+                    if day_data:
+                        periods = max(periods, min(day_data[0], len(day_data) - 1) + 1)
+
+        class_counts = array('H', [len(grade_data) for grade_data in current_timetable])
+        day_counts = array('H', bytes(2 * grades * classes))
+        current = array(CODE_TYPECODE, bytes(4 * grades * classes * days * periods))
+        original = array(CODE_TYPECODE, bytes(4 * grades * classes * days * periods))
+
+        for grade_idx in range(1, grades):
+            for class_idx in range(1, class_counts[grade_idx]):
+                original_class = original_timetable[grade_idx][class_idx]
+                day_counts[grade_idx * classes + class_idx] = original_class[0]
+
+                base = (grade_idx * classes + class_idx) * days * periods
+                cls._pack_class(current, base, periods, current_timetable[grade_idx][class_idx])
+                cls._pack_class(original, base, periods, original_class)
+
+        return cls(grades, classes, days, periods, class_counts, day_counts, current, original, subjects, teachers)
+
+    @staticmethod
+    def _pack_class(target: array, base: int, periods: int, class_data: List) -> None:
+        """Copy the days of one class into the packed array starting at base."""
+        for day in range(1, len(class_data)):
+            day_data = class_data[day]
+            if not day_data:
+                continue
+
+            offset = base + day * periods
+            count = day_data[0]
+            target[offset] = count
+            for period in range(1, min(count, len(day_data) - 1) + 1):
+                target[offset + period] = day_data[period]
+
+    def offset(self, grade: int, cls: int, day: int) -> int:
+        """Index of slot 0 of a (grade, class, day) in the packed arrays."""
+        return ((grade * self.classes + cls) * self.days + day) * self.periods
+
+    def class_count(self, grade: int) -> int:
+        """Number of classes of a grade, including the empty class 0."""
+        return self.class_counts[grade]
+
+    def day_count(self, grade: int, cls: int) -> int:
+        """Number of days of a class."""
+        return self.day_counts[grade * self.classes + cls]
+
+    def subject(self, code: int) -> str:
+        """Subject name of a period code."""
+        subject_idx = code // 1000
+        return self.subjects[subject_idx] if subject_idx < len(self.subjects) else ""
+
+    def teacher(self, code: int) -> str:
+        """Teacher name of a period code."""
+        teacher_idx = code % 100
+        return self.teachers[teacher_idx] if teacher_idx < len(self.teachers) else ""
+
+
+class LazyDays(Sequence):
+    """
+    Days of a single class, decoded on first access and memoized.
+
+    Index 0 is an empty placeholder, like in the eagerly built timetable.
+    """
+
+    def __init__(self, decode_day: Callable[[int], list], day_count: int):
+        self._decode_day = decode_day
+        self._days: List[Optional[list]] = [[]] + [None] * day_count
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._days)))]
+
+        day = self._days[index]
+        if day is None:
+            if index < 0:
+                index += len(self._days)
+            day = self._days[index] = self._decode_day(index)
+        return day
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class LazyClasses(Sequence):
+    """Classes of a single grade; each class is a LazyDays created on first access."""
+
+    def __init__(self, make_class: Callable[[int], LazyDays], class_count: int):
+        self._make_class = make_class
+        self._classes: List[Optional[Sequence]] = [[]] + [None] * (class_count - 1)
+
+    def __len__(self) -> int:
+        return len(self._classes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._classes)))]
+
+        days = self._classes[index]
+        if days is None:
+            if index < 0:
+                index += len(self._classes)
+            days = self._classes[index] = self._make_class(index)
+        return days
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class LazyGrid(Sequence):
+    """
+    Drop-in replacement for the nested timetable list that decodes on demand.
+
+    ``grid[grade][cls][day]`` returns the same list of TimeTableData as the
+    eager timetable, but only that day is decoded, the first time it is read.
+    """
+
+    def __init__(self, grade_count: int, class_count: Callable[[int], int], day_count: Callable[[int, int], int],
+                 decode_day: Callable[[int, int, int], list]):
+        """
+        Args:
+            grade_count (int): Number of grades including the empty grade 0
+            class_count (Callable): grade -> number of classes including the empty class 0
+            day_count (Callable): (grade, cls) -> number of days
+            decode_day (Callable): (grade, cls, day) -> list of TimeTableData
+        """
+        self._class_count = class_count
+        self._day_count = day_count
+        self._decode_day = decode_day
+        self._grades: List[Optional[Sequence]] = [[]] + [None] * (grade_count - 1)
+
+    def __len__(self) -> int:
+        return len(self._grades)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._grades)))]
+
+        classes = self._grades[index]
+        if classes is None:
+            if index < 0:
+                index += len(self._grades)
+            classes = self._grades[index] = LazyClasses(
+                lambda cls, grade=index: self._make_class(grade, cls), self._class_count(index)
+            )
+        return classes
+
+    def _make_class(self, grade: int, cls: int) -> LazyDays:
+        return LazyDays(lambda day: self._decode_day(grade, cls, day), self._day_count(grade, cls))
+
+    def __repr__(self) -> str:
+        return repr(list(self))
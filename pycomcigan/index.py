@@ -0,0 +1,137 @@
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .grid import PeriodGrid
+
+# Periods that are always indexed, matching the 8 periods guaranteed by the timetable
+MIN_PERIODS = 8
+
+
+class Slot(NamedTuple):
+    """A single period of a class."""
+    grade: int
+    cls: int
+    day: int
+    period: int
+    subject: str
+    teacher: str
+
+
+class TimeTableIndex:
+    """
+    Inverted indexes over the current timetable of a school.
+
+    Built in a single pass over the packed period codes, after which every
+    query only touches the slots it returns.
+    """
+
+    def __init__(self, grid: PeriodGrid):
+        """
+        Args:
+            grid (PeriodGrid): Packed period codes of the school
+        """
+        self._teacher_slots: Dict[str, Dict[int, List[Slot]]] = {}
+        self._subject_classes: Dict[Tuple[str, int, int], List[Tuple[int, int]]] = {}
+        self._free_teachers: Dict[Tuple[int, int], List[str]] = {}
+        self._free_periods: Dict[str, Dict[int, List[int]]] = {}
+
+        busy: Dict[Tuple[int, int], set] = {}
+        current = grid.current
+        max_period = max(grid.periods - 1, MIN_PERIODS)
+
+        for grade in range(1, grid.grades):
+            for cls in range(1, grid.class_count(grade)):
+                for day in range(1, grid.day_count(grade, cls) + 1):
+                    if day >= grid.days:
+                        break
+                    offset = grid.offset(grade, cls, day)
+
+                    for period in range(1, grid.periods):
+                        code = current[offset + period]
+                        if code == 0:
+                            continue
+
+                        subject = grid.subject(code)
+                        teacher = grid.teacher(code)
+                        slot = Slot(grade, cls, day, period, subject, teacher)
+
+                        self._subject_classes.setdefault((subject, day, period), []).append((grade, cls))
+                        if teacher:
+                            self._teacher_slots.setdefault(teacher, {}).setdefault(day, []).append(slot)
+                            busy.setdefault((day, period), set()).add(teacher)
+
+        for days in self._teacher_slots.values():
+            for slots in days.values():
+                slots.sort(key=lambda slot: slot.period)
+
+        # Free periods per teacher, for every day that appears in the timetable
+        teachers = [teacher for teacher in dict.fromkeys(grid.teachers) if teacher]
+        days = range(1, max([grid.day_count(grade, cls)
+                             for grade in range(1, grid.grades)
+                             for cls in range(1, grid.class_count(grade))] + [0]) + 1)
+        for day in days:
+            for period in range(1, max_period + 1):
+                busy_teachers = busy.get((day, period), set())
+                free = [teacher for teacher in teachers if teacher not in busy_teachers]
+                self._free_teachers[(day, period)] = free
+                for teacher in free:
+                    self._free_periods.setdefault(teacher, {}).setdefault(day, []).append(period)
+
+    def teacher_schedule(self, teacher: str, day: Optional[int] = None) -> List[Slot]:
+        """
+        Get every period a teacher teaches.
+
+        Args:
+            teacher (str): Teacher name
+            day (int, optional): Only return periods of this day
+
+        Returns:
+            List[Slot]: Periods sorted by day and period
+        """
+        days = self._teacher_slots.get(teacher, {})
+        if day is not None:
+            return list(days.get(day, []))
+        return [slot for day_idx in sorted(days) for slot in days[day_idx]]
+
+    def classes_with(self, subject: str, day: int, period: int) -> List[Tuple[int, int]]:
+        """
+        Get the classes having a subject in a period.
+
+        Args:
+            subject (str): Subject name
+            day (int): Day (1 = Monday)
+            period (int): Period number
+
+        Returns:
+            List[Tuple[int, int]]: (grade, class) pairs
+        """
+        return list(self._subject_classes.get((subject, day, period), []))
+
+    def free_teachers(self, day: int, period: int) -> List[str]:
+        """
+        Get the teachers without a class in a period.
+
+        Args:
+            day (int): Day (1 = Monday)
+            period (int): Period number
+
+        Returns:
+            List[str]: Teacher names in the order of the teacher table
+        """
+        return list(self._free_teachers.get((day, period), []))
+
+    def free_periods(self, teacher: str, day: int) -> List[int]:
+        """
+        Get the periods in which a teacher has no class.
+
+        Args:
+            teacher (str): Teacher name
+            day (int): Day (1 = Monday)
+
+        Returns:
+            List[int]: Period numbers
+        """
+        return list(self._free_periods.get(teacher, {}).get(day, []))
+
+    def teachers(self) -> List[str]:
+        """Get every teacher that teaches at least one period."""
+        return list(self._teacher_slots)
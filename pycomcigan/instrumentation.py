@@ -0,0 +1,153 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Deque, Dict, Iterator, NamedTuple, Optional
+
+# Phases reported to observers
+ST_DOWNLOAD = 'st_download'  # Download of the /st page
+CODE_PARSE = 'code_parse'  # Regex extraction of the service codes
+CODE_CACHE = 'code_cache'  # Lookup in the service code cache (cache_hit is set)
+DIRECTORY = 'directory'  # Lookup in a SchoolDirectory (cache_hit is set)
+SEARCH = 'search'  # School search request and parsing
+TIMETABLE_DOWNLOAD = 'timetable_download'  # Timetable request
+JSON_PARSE = 'json_parse'  # Parsing of the timetable response
+BUILD = 'build'  # Packing and decoding of the timetable
+TOTAL = 'total'  # Whole TimeTable construction
+TIMETABLE_CACHE = 'timetable_cache'  # TimeTableCache.get() (cache_hit is set, stale entries count as hits)
+
+
+class PhaseEvent(NamedTuple):
+    """Timing of a single phase, reported to observers."""
+    phase: str
+    start: float
+    end: float
+    bytes: int = 0
+    cache_hit: Optional[bool] = None
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+Observer = Callable[[PhaseEvent], None]
+
+_observer: ContextVar[Optional[Observer]] = ContextVar('pycomcigan_observer', default=None)
+
+
+def current_observer() -> Optional[Observer]:
+    """Observer of the current context, or None when instrumentation is disabled."""
+    return _observer.get()
+
+
+@contextmanager
+def instrument(observer: Optional[Observer]) -> Iterator[Optional[Observer]]:
+    """
+    Report the phases of everything run inside the block to an observer.
+
+    The observer is bound to the current context, so it follows asyncio tasks
+    and fetch_many() workers but not unrelated threads.
+
+    Args:
+        observer (Callable[[PhaseEvent], None]): Called with every PhaseEvent (None disables)
+    """
+    token = _observer.set(observer)
+    try:
+        yield observer
+    finally:
+        _observer.reset(token)
+
+
+def emit(observer: Observer, phase: str, start: float, nbytes: int = 0, cache_hit: Optional[bool] = None) -> None:
+    """Report a phase that started at `start` (time.perf_counter()) and ends now."""
+    observer(PhaseEvent(phase, start, time.perf_counter(), nbytes, cache_hit))
+
+
+class TimingStats:
+    """
+    Observer aggregating phase timings across many requests.
+
+    Keeps the latest `window` durations of every phase for percentiles.
+
+        stats = TimingStats()
+        with instrument(stats):
+            TimeTable("경기북과학고")
+        stats.summary()
+    """
+
+    def __init__(self, window: int = 10000):
+        """
+        Args:
+            window (int): Number of recent durations kept per phase
+        """
+        self.window = window
+        self._durations: Dict[str, Deque[float]] = {}
+        self._counts: Dict[str, int] = {}
+        self._bytes: Dict[str, int] = {}
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: PhaseEvent) -> None:
+        with self._lock:
+            if event.phase not in self._durations:
+                self._durations[event.phase] = deque(maxlen=self.window)
+            self._durations[event.phase].append(event.duration)
+            self._counts[event.phase] = self._counts.get(event.phase, 0) + 1
+            self._bytes[event.phase] = self._bytes.get(event.phase, 0) + event.bytes
+            if event.cache_hit is not None:
+                counters = self._hits if event.cache_hit else self._misses
+                counters[event.phase] = counters.get(event.phase, 0) + 1
+
+    def percentile(self, phase: str, percent: float) -> float:
+        """Duration percentile (0-100) of a phase in seconds, 0.0 if never seen."""
+        with self._lock:
+            durations = sorted(self._durations.get(phase, ()))
+        return self._percentile(durations, percent)
+
+    @staticmethod
+    def _percentile(durations: list, percent: float) -> float:
+        if not durations:
+            return 0.0
+        index = min(len(durations) - 1, max(0, int(round(percent / 100 * (len(durations) - 1)))))
+        return durations[index]
+
+    def summary(self) -> Dict[str, dict]:
+        """
+        Get the aggregated statistics of every phase.
+
+        Returns:
+            dict: {phase: {count, bytes, mean, p50, p90, p95, p99, max, hits, misses}} with durations in seconds
+        """
+        with self._lock:
+            phases = {phase: sorted(durations) for phase, durations in self._durations.items()}
+            counts = dict(self._counts)
+            nbytes = dict(self._bytes)
+            hits = dict(self._hits)
+            misses = dict(self._misses)
+
+        summary = {}
+        for phase, durations in phases.items():
+            summary[phase] = {
+                'count': counts[phase],
+                'bytes': nbytes[phase],
+                'mean': sum(durations) / len(durations),
+                'p50': self._percentile(durations, 50),
+                'p90': self._percentile(durations, 90),
+                'p95': self._percentile(durations, 95),
+                'p99': self._percentile(durations, 99),
+                'max': durations[-1],
+                'hits': hits.get(phase, 0),
+                'misses': misses.get(phase, 0),
+            }
+        return summary
+
+    def reset(self) -> None:
+        """Forget everything collected so far."""
+        with self._lock:
+            self._durations.clear()
+            self._counts.clear()
+            self._bytes.clear()
+            self._hits.clear()
+            self._misses.clear()
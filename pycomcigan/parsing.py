@@ -0,0 +1,52 @@
+import json
+from typing import Any, List, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+Content = Union[bytes, str]
+
+
+def loads(content: Content) -> Any:
+    """Decode JSON with orjson when it is installed, else with the json module."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def first_line(content: Content) -> Content:
+    """Return the first line of a response body without splitting the rest of it."""
+    end = content.find(b'\n' if isinstance(content, bytes) else '\n')
+    return content if end < 0 else content[:end]
+
+
+def parse_timetable_body(content: Content) -> dict:
+    """
+    Parse the JSON on the first line of a timetable response.
+
+    Args:
+        content (bytes | str): Raw (UTF-8) or decoded response body
+
+    Returns:
+        dict: The timetable data
+    """
+    return loads(first_line(content))
+
+
+def parse_search_body(content: Content) -> List[List]:
+    """
+    Parse a school search response, removing null characters.
+
+    Args:
+        content (bytes | str): Raw (UTF-8) or decoded response body
+
+    Returns:
+        List[List]: [[region_code, region_name, school_name, school_code], ...]
+    """
+    null = b'\0' if isinstance(content, bytes) else '\0'
+    # Only copy the body when there is something to strip
+    if content.startswith(null) or content.endswith(null):
+        content = content.strip(null)
+    return loads(content)["학교검색"]
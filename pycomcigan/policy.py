@@ -0,0 +1,232 @@
+import queue
+import random
+import threading
+import time
+from collections import deque
+from typing import Callable, Collection, Deque, Optional, Tuple, Union
+
+import requests
+
+Timeout = Union[None, float, Tuple[float, float]]
+
+# Default (connect, read) timeout in seconds
+DEFAULT_TIMEOUT = (5.0, 15.0)
+
+# Statuses worth retrying, the server being overloaded or restarting
+RETRY_STATUSES = (500, 502, 503, 504)
+
+# Latencies needed before hedging with the observed percentile
+MIN_HEDGE_SAMPLES = 20
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of sending a request while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker failing fast while the upstream is down.
+
+    Opens after `failure_threshold` consecutive failures. Once `reset_timeout`
+    has passed a single trial request is let through, closing the breaker on
+    success and opening it again on failure.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Args:
+            failure_threshold (int): Consecutive failures opening the breaker
+            reset_timeout (float): Seconds the breaker stays open before a trial request
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """'closed', 'open' or 'half_open'."""
+        with self._lock:
+            if self._opened_at is None:
+                return 'closed'
+            if self._trial or time.monotonic() - self._opened_at >= self.reset_timeout:
+                return 'half_open'
+            return 'open'
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial or time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self._trial = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial = False
+
+
+class RequestPolicy:
+    """
+    Timeouts, retries, hedging and circuit breaking applied to every request of a ComciganClient.
+
+    Connection errors, timeouts and RETRY_STATUSES responses are retried with
+    jittered exponential backoff. With hedging, a second identical request is
+    sent when the first hasn't answered after `hedge_after` seconds (default:
+    the 95th percentile of recent latencies) and the first response wins.
+    """
+
+    def __init__(self, timeout: Timeout = DEFAULT_TIMEOUT, retries: int = 2, backoff: float = 0.1,
+                 max_backoff: float = 5.0, retry_statuses: Collection[int] = RETRY_STATUSES, hedge: bool = False,
+                 hedge_after: Optional[float] = None, breaker: Optional[CircuitBreaker] = None,
+                 latency_window: int = 200):
+        """
+        Args:
+            timeout (float | tuple, optional): requests timeout, either seconds or (connect, read)
+            retries (int): Retries after the first attempt
+            backoff (float): Base delay in seconds, doubled after every retry
+            max_backoff (float): Maximum delay between retries in seconds
+            retry_statuses (Collection[int]): HTTP statuses that are retried
+            hedge (bool): Send a hedged request when the first one is slow
+            hedge_after (float, optional): Seconds before hedging (default: observed 95th percentile latency)
+            breaker (CircuitBreaker, optional): Circuit breaker shared by the requests
+            latency_window (int): Number of recent latencies kept for the hedging percentile
+        """
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.hedge = hedge
+        self.hedge_after = hedge_after
+        self.breaker = breaker
+        self._latencies: Deque[float] = deque(maxlen=latency_window)
+        self._lock = threading.Lock()
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Delay before retry number `attempt` (0-based), with full jitter."""
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds before a hedged request is sent, None if not hedging (yet)."""
+        if not self.hedge:
+            return None
+        if self.hedge_after is not None:
+            return self.hedge_after
+
+        with self._lock:
+            if len(self._latencies) < MIN_HEDGE_SAMPLES:
+                return None
+            latencies = sorted(self._latencies)
+        return latencies[int(0.95 * (len(latencies) - 1))]
+
+    def execute(self, send: Callable[[Timeout], requests.Response], timeout: Timeout = None) -> requests.Response:
+        """
+        Send a request with the policy applied.
+
+        Args:
+            send (Callable): Sends the request with the given timeout and returns the response
+            timeout (float | tuple, optional): Timeout overriding the policy's one
+
+        Returns:
+            requests.Response: The first response without a retryable status
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open
+            requests.HTTPError: If the last attempt still had a retryable status
+            requests.RequestException: If the last attempt failed
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self.backoff_delay(attempt - 1))
+            if self.breaker is not None and not self.breaker.allow():
+                raise CircuitOpenError('Comcigan circuit breaker is open')
+
+            try:
+                response = self._send(send, timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                self._record_failure()
+                if attempt == self.retries:
+                    raise
+                continue
+            except Exception:
+                # Not retried, but still ends a half-open trial
+                self._record_failure()
+                raise
+
+            if response.status_code in self.retry_statuses:
+                self._record_failure()
+                if attempt == self.retries:
+                    response.raise_for_status()
+                continue
+
+            if self.breaker is not None:
+                self.breaker.record_success()
+            return response
+
+    def _record_failure(self) -> None:
+        if self.breaker is not None:
+            self.breaker.record_failure()
+
+    def _send(self, send: Callable[[Timeout], requests.Response], timeout: Timeout) -> requests.Response:
+        """Send once, hedging and recording the latency if enabled."""
+        if not self.hedge:
+            return send(timeout)
+
+        start = time.perf_counter()
+        delay = self.hedge_delay()
+        response = send(timeout) if delay is None else self._send_hedged(send, timeout, delay)
+        self._record_latency(time.perf_counter() - start)
+        return response
+
+    def _record_latency(self, latency: float) -> None:
+        with self._lock:
+            self._latencies.append(latency)
+
+    def _send_hedged(self, send: Callable[[Timeout], requests.Response], timeout: Timeout,
+                     delay: float) -> requests.Response:
+        """
+        Send a second request if the first hasn't answered after `delay` and return the first to succeed.
+
+        Both requests get a thread of their own as soon as they are due. A shared
+        pool would cap the client's concurrency and count time spent queued
+        against `delay`.
+        """
+        results: 'queue.Queue[Tuple[bool, object]]' = queue.Queue()
+
+        def run() -> None:
+            try:
+                results.put((True, send(timeout)))
+            except BaseException as error:
+                results.put((False, error))
+
+        threading.Thread(target=run, name='pycomcigan-request', daemon=True).start()
+        sent = 1
+        try:
+            ok, value = results.get(timeout=delay)
+        except queue.Empty:
+            threading.Thread(target=run, name='pycomcigan-hedge', daemon=True).start()
+            sent = 2
+            ok, value = results.get()
+
+        # The slower request finishes in the background; its connection returns to the pool
+        while not ok and sent > 1:
+            sent -= 1
+            ok, value = results.get()
+        if ok:
+            return value
+        raise value
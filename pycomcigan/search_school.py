@@ -1,50 +1,46 @@
-import json
-import re
-from typing import List
-from urllib import parse
+from typing import List, Optional
 
-import requests
+from .client import COMCIGAN_URL, HEADERS, ComciganClient, get_default_client
+from .codes import code_cache
+from .directory import SchoolDirectory
+from .timetable import TimeTable
 
-# Constants for Comcigan API
-COMCIGAN_URL = 'http://comci.net:4082'
-HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/106.0.0.0 Safari/537.36'
-}
 
-
-def get_comcigan_code() -> str:
+def get_comcigan_code(client: Optional[ComciganClient] = None) -> str:
     """
     Fetch Comcigan service code from the main page.
 
+    The code is served from the process-wide code cache.
+
+    Args:
+        client (ComciganClient, optional): Client used for the request (default: module-wide client)
+
     Returns:
         str: The extracted Comcigan service code
     """
-    response = requests.get(COMCIGAN_URL + '/st', headers=HEADERS)
-    response.encoding = 'euc-kr'
+    return code_cache.get(client)[0]
 
-    return re.findall('\\.\\/[0-9]+\\?[0-9]+l', response.text)[0][1:]
 
-
-def get_school_code(school_name: str) -> List[List]:
+def get_school_code(school_name: str, client: Optional[ComciganClient] = None,
+                    directory: Optional[SchoolDirectory] = None) -> List[List]:
     """
     Search for schools by name and return their information.
 
     Args:
         school_name (str): Name of the school to search for
+        client (ComciganClient, optional): Client used for the requests (default: module-wide client)
+        directory (SchoolDirectory, optional): Local school directory the results are added to
 
     Returns:
         List[List]: List of school information in format:
                    [[region_code, region_name, school_name, school_code], ...]
     """
-    comcigan_code = get_comcigan_code()
-
-    # Build search URL with encoded school name
-    search_url = COMCIGAN_URL + comcigan_code + parse.quote(school_name, encoding='euc-kr')
-
-    response = requests.get(search_url, headers=HEADERS)
-    response.encoding = 'UTF-8'
+    client = client or get_default_client()
+    search_results, _ = code_cache.call_with_codes(
+        client, lambda codes: TimeTable._search(school_name, codes[0], client)
+    )
 
-    # Parse response and remove null characters
-    parsed_data = json.loads(response.text.strip(chr(0)))
+    if directory is not None:
+        directory.add(search_results)
+    return search_results
 
-    return parsed_data["학교검색"]
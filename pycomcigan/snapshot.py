@@ -0,0 +1,175 @@
+import gzip
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Tuple
+
+from .grid import CODE_TYPECODE, PeriodGrid
+
+SNAPSHOT_VERSION = 1
+
+# Binary layout: magic, version, header length, JSON header, padding to 4 bytes,
+# then class_counts ('H'), day_counts ('H'), padding to 4 bytes, current and original ('i')
+BINARY_MAGIC = b'PCTT'
+GZIP_MAGIC = b'\x1f\x8b'
+_PREFIX = struct.Struct('<4sBI')
+
+# Keys of the packed arrays in the order they are written
+_ARRAYS = (('class_counts', 'H'), ('day_counts', 'H'), ('current', CODE_TYPECODE), ('original', CODE_TYPECODE))
+
+
+def save_snapshot(path: str, state: dict, grid: PeriodGrid, format: str = 'binary') -> None:
+    """
+    Write a timetable snapshot.
+
+    Args:
+        path (str): Destination file
+        state (dict): School information and homeroom teachers (JSON serializable)
+        grid (PeriodGrid): Packed period codes
+        format (str): 'binary' (memory-mappable) or 'json' (gzip compressed JSON)
+    """
+    header = dict(state, version=SNAPSHOT_VERSION, byteorder=sys.byteorder, grid={
+        'grades': grid.grades,
+        'classes': grid.classes,
+        'days': grid.days,
+        'periods': grid.periods,
+        'subjects': grid.subjects,
+        'teachers': grid.teachers,
+    })
+
+    if format == 'json':
+        header['arrays'] = {name: list(getattr(grid, name)) for name, _ in _ARRAYS}
+        with _replace_atomically(path) as raw_file, gzip.open(raw_file, 'wt', encoding='utf-8') as file:
+            json.dump(header, file, ensure_ascii=False, separators=(',', ':'))
+        return
+
+    if format != 'binary':
+        raise ValueError("format must be 'binary' or 'json'")
+
+    header_bytes = json.dumps(header, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    with _replace_atomically(path) as file:
+        file.write(_PREFIX.pack(BINARY_MAGIC, SNAPSHOT_VERSION, len(header_bytes)))
+        file.write(header_bytes)
+        _pad(file)
+        for name, typecode in _ARRAYS:
+            if typecode == CODE_TYPECODE:
+                _pad(file)
+            file.write(array(typecode, getattr(grid, name)).tobytes())
+
+
+@contextmanager
+def _replace_atomically(path: str) -> Iterator[BinaryIO]:
+    """
+    Write to a temporary file next to path and move it over path once complete.
+
+    Processes that memory-mapped the old snapshot keep their (now unlinked)
+    file instead of seeing it truncated, and a failed write leaves path untouched.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            yield file
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def load_snapshot(path: str, use_mmap: bool = False) -> Tuple[dict, PeriodGrid]:
+    """
+    Read a timetable snapshot written by save_snapshot().
+
+    Args:
+        path (str): Snapshot file
+        use_mmap (bool): Memory-map a binary snapshot instead of reading it, so
+            processes loading the same file share its pages
+
+    Returns:
+        Tuple[dict, PeriodGrid]: School information and the packed period codes
+
+    Raises:
+        ValueError: If the file is not a snapshot or has an unsupported version
+    """
+    with open(path, 'rb') as file:
+        magic = file.read(4)
+        file.seek(0)
+
+        if magic[:2] == GZIP_MAGIC:
+            with gzip.open(file, 'rt', encoding='utf-8') as gzip_file:
+                header = json.load(gzip_file)
+            _check_version(header)
+            values = header.pop('arrays')
+            arrays = {name: array(typecode, values[name]) for name, typecode in _ARRAYS}
+            return header, _make_grid(header, arrays)
+
+        if magic != BINARY_MAGIC:
+            raise ValueError('not a timetable snapshot')
+
+        if use_mmap:
+            buffer = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+        else:
+            buffer = memoryview(file.read())
+
+    _, version, header_length = _PREFIX.unpack_from(buffer)
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"unsupported snapshot version: {version}")
+
+    offset = _PREFIX.size
+    header = json.loads(bytes(buffer[offset:offset + header_length]).decode('utf-8'))
+    offset = _align(offset + header_length)
+
+    grid_header = header['grid']
+    sizes = {
+        'class_counts': grid_header['grades'],
+        'day_counts': grid_header['grades'] * grid_header['classes'],
+        'current': grid_header['grades'] * grid_header['classes'] * grid_header['days'] * grid_header['periods'],
+    }
+    sizes['original'] = sizes['current']
+
+    swap = header['byteorder'] != sys.byteorder
+    arrays = {}
+    for name, typecode in _ARRAYS:
+        if typecode == CODE_TYPECODE:
+            offset = _align(offset)
+        length = sizes[name] * array(typecode).itemsize
+        view = buffer[offset:offset + length]
+        offset += length
+
+        if swap:
+            # Foreign byte order can't be used in place
+            values = array(typecode, bytes(view))
+            values.byteswap()
+            arrays[name] = values
+        else:
+            arrays[name] = view.cast(typecode)
+
+    return header, _make_grid(header, arrays)
+
+
+def _make_grid(header: dict, arrays: dict) -> PeriodGrid:
+    grid_header = header['grid']
+    return PeriodGrid(
+        grid_header['grades'], grid_header['classes'], grid_header['days'], grid_header['periods'],
+        arrays['class_counts'], arrays['day_counts'], arrays['current'], arrays['original'],
+        grid_header['subjects'], grid_header['teachers']
+    )
+
+
+def _check_version(header: dict) -> None:
+    if header.get('version') != SNAPSHOT_VERSION:
+        raise ValueError(f"unsupported snapshot version: {header.get('version')}")
+
+
+def _align(offset: int) -> int:
+    return (offset + 3) & ~3
+
+
+def _pad(file) -> None:
+    position = file.tell()
+    file.write(b'\0' * (_align(position) - position))
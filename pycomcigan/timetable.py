@@ -1,21 +1,26 @@
 import base64
-import json
-import re
-from typing import List, Optional, Tuple
+import time
+from typing import List, Optional, Tuple, Union
 from urllib import parse
 
-import requests
-
-# Constants for Comcigan API
-COMCIGAN_URL = 'http://comci.net:4082'
-HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/106.0.0.0 Safari/537.36'
-}
+from .changes import Change, diff_grids, resized_days, same_shape
+from .client import COMCIGAN_URL, HEADERS, ComciganClient, get_default_client
+from .codes import code_cache
+from .columnar import TimeTableArrays, to_arrays, to_dataframe
+from .directory import SchoolDirectory
+from .grid import LazyGrid, PeriodGrid
+from .index import Slot, TimeTableIndex
+from .instrumentation import (BUILD, DIRECTORY, JSON_PARSE, SEARCH, TIMETABLE_DOWNLOAD, TOTAL, current_observer,
+                              emit)
+from .parsing import parse_search_body, parse_timetable_body
+from .snapshot import load_snapshot, save_snapshot
 
 
 class Lecture:
     """Represents a single lecture with period, subject, and teacher information."""
 
+    __slots__ = ('period', 'subject', 'teacher')
+
     def __init__(self, period: int, subject: str, teacher: str):
         self.period = period
         self.subject = subject
@@ -31,6 +36,8 @@ class Lecture:
 class TimeTableData:
     """Represents timetable data including replacement information."""
 
+    __slots__ = ('period', 'subject', 'teacher', 'replaced', 'original')
+
     def __init__(self, period: int, subject: str, teacher: str, replaced: bool, original: Optional[Lecture]):
         self.period = period
         self.subject = subject
@@ -56,7 +63,9 @@ class TimeTable:
     THURSDAY = 4
     FRIDAY = 5
 
-    def __init__(self, school_name: str, local_code: int = 0, school_code: int = 0, week_num: int = 0):
+    def __init__(self, school_name: str, local_code: int = 0, school_code: int = 0, week_num: int = 0,
+                 client: Optional[ComciganClient] = None, lazy: bool = False,
+                 directory: Optional[SchoolDirectory] = None):
         """
         Initialize TimeTable with school information.
 
@@ -65,30 +74,45 @@ class TimeTable:
             local_code (int, optional): Education office code
             school_code (int, optional): School code
             week_num (int): Week number (0 for current week, 1 for next week)
+            client (ComciganClient, optional): Client used for the requests (default: module-wide client)
+            lazy (bool): Decode each day of the timetable on first access instead of all at once
+            directory (SchoolDirectory, optional): Local school directory used to skip the search
+                request for known schools; search results are added to it
 
         Raises:
             ValueError: If week_num is not 0 or 1, or if codes are not integers
             RuntimeError: If multiple schools found or school not found
         """
         self._validate_inputs(week_num, local_code, school_code)
+        observer = current_observer()
+        start = time.perf_counter() if observer is not None else 0.0
+        self._client = client or get_default_client()
+        self._lazy = lazy
+        self._week_num = week_num
 
-        # Fetch Comcigan service codes
-        comcigan_codes = self._get_comcigan_codes()
+        self._load(school_name, local_code, school_code, directory)
 
-        # Resolve school information
-        resolved_local_code, resolved_school_name, resolved_school_code = self._resolve_school(
-            school_name, local_code, school_code, comcigan_codes[0]
-        )
+        if observer is not None:
+            emit(observer, TOTAL, start)
 
-        # Fetch timetable data
-        timetable_data = self._fetch_timetable_data(
-            resolved_school_code, week_num, comcigan_codes
-        )
+    def _load(self, school_name: str, local_code: int, school_code: int,
+              directory: Optional[SchoolDirectory] = None, request_client: Optional[ComciganClient] = None) -> None:
+        """
+        Resolve the school, fetch its timetable and initialize from it.
 
-        # Initialize instance variables
-        self._initialize_from_data(
-            timetable_data, resolved_local_code, resolved_school_name, resolved_school_code, comcigan_codes
-        )
+        Args:
+            request_client (ComciganClient, optional): Client sending the requests instead of the
+                stored one (fetch_many's rate-limited wrapper)
+        """
+        request_client = request_client or self._client
+        resolved, comcigan_codes = self._resolve_with_codes(school_name, local_code, school_code, request_client,
+                                                            directory)
+
+        def load(codes: Tuple) -> None:
+            timetable_data = self._fetch_timetable_data(resolved[2], self._week_num, codes, request_client)
+            self._initialize_from_data(timetable_data, *resolved, codes)
+
+        code_cache.call_with_codes(request_client, load, comcigan_codes)
 
     @staticmethod
     def _validate_inputs(week_num: int, local_code: int, school_code: int) -> None:
@@ -103,47 +127,74 @@ class TimeTable:
             raise ValueError('local_code and school_code must be integers')
 
     @staticmethod
-    def _get_comcigan_codes() -> Tuple[str, str, str, str, str, str, str]:
-        """Fetch all necessary service codes from Comcigan."""
-        response = requests.get(COMCIGAN_URL + '/st', headers=HEADERS)
-        response.encoding = 'euc-kr'
-        content = response.text
-
-        # Extract various codes using regex patterns
-        patterns = {
-            'comcigan_code': '\\.\\/[0-9]+\\?[0-9]+l',
-            'code0': "sc_data\\(\'[0-9]+_",
-            'code1': '성명=자료.자료[0-9]+',
-            'code2': '자료.자료[0-9]+\\[sb\\]',
-            'code3': '=H시간표.자료[0-9]+',
-            'code4': '일일자료=Q자료\\(자료\\.자료[0-9]+',
-            'code5': '원자료=Q자료\\(자료\\.자료[0-9]+'
-        }
-
-        comcigan_code = re.findall(patterns['comcigan_code'], content)[0][1:]
-        code0 = re.findall(patterns['code0'], content)[0][9:-1]
-        code1 = re.findall(patterns['code1'], content)[0][8:]
-        code2 = re.findall(patterns['code2'], content)[0][5:-4]
-        code3 = re.findall(patterns['code3'], content)[0][8:]
-        code4 = re.findall(patterns['code4'], content)[0][14:]
-        code5 = re.findall(patterns['code5'], content)[0][13:]
+    def _get_comcigan_codes(client: Optional[ComciganClient] = None) -> Tuple[str, str, str, str, str, str, str]:
+        """Fetch all necessary service codes from Comcigan (served from the shared code cache)."""
+        return code_cache.get(client)
+
+    @classmethod
+    def _resolve_school(cls, school_name: str, local_code: int, school_code: int, comcigan_code: str,
+                        client: Optional[ComciganClient] = None,
+                        directory: Optional[SchoolDirectory] = None) -> Tuple[int, str, int]:
+        """Resolve school information from the directory, or from search results."""
+        observer = current_observer()
+        if directory is not None:
+            start = time.perf_counter() if observer is not None else 0.0
+            resolved = directory.resolve(school_name, local_code, school_code)
+            if observer is not None:
+                emit(observer, DIRECTORY, start, cache_hit=resolved is not None)
+            if resolved is not None:
+                return resolved
+
+        search_results = cls._search(school_name, comcigan_code, client)
+        if directory is not None:
+            directory.add(search_results)
+            # An exact (normalized) name match settles otherwise ambiguous results
+            if len(search_results) > 1 and not (local_code or school_code):
+                resolved = directory.resolve(school_name)
+                if resolved is not None:
+                    return resolved
+
+        return cls._select_school(search_results, local_code, school_code)
+
+    @classmethod
+    def _resolve_with_codes(cls, school_name: str, local_code: int, school_code: int,
+                            client: Optional[ComciganClient] = None,
+                            directory: Optional[SchoolDirectory] = None) -> Tuple[Tuple[int, str, int], Tuple]:
+        """Resolve the school with the cached service codes, retrying once if they have rotated."""
+        return code_cache.call_with_codes(
+            client, lambda codes: cls._resolve_school(school_name, local_code, school_code, codes[0], client, directory)
+        )
 
-        return comcigan_code, code0, code1, code2, code3, code4, code5
+    @classmethod
+    def _search(cls, school_name: str, comcigan_code: str,
+                client: Optional[ComciganClient] = None) -> List[List]:
+        """Send a school search request with the given service code and parse it."""
+        client = client or get_default_client()
+        observer = current_observer()
+        start = time.perf_counter() if observer is not None else 0.0
+        response = client.get(cls._search_path(comcigan_code, school_name), encoding='UTF-8')
+        search_results = cls._parse_search_response(response.content)
+        if observer is not None:
+            emit(observer, SEARCH, start, len(response.content))
+        return search_results
 
-    def _resolve_school(self, school_name: str, local_code: int, school_code: int, comcigan_code: str) -> Tuple[
-        int, str, int]:
-        """Resolve school information from search results."""
-        search_url = COMCIGAN_URL + comcigan_code + parse.quote(school_name, encoding='euc-kr')
-        response = requests.get(search_url, headers=HEADERS)
-        response.encoding = 'UTF-8'
+    @staticmethod
+    def _search_path(comcigan_code: str, school_name: str) -> str:
+        """Build the school search path with the EUC-KR encoded school name."""
+        return comcigan_code + parse.quote(school_name, encoding='euc-kr')
 
-        parsed_data = json.loads(response.text.strip(chr(0)))
-        search_results = parsed_data["학교검색"]
+    @staticmethod
+    def _parse_search_response(content: Union[bytes, str]) -> List[List]:
+        """Parse a school search response (raw or decoded), removing null characters."""
+        return parse_search_body(content)
 
+    @classmethod
+    def _select_school(cls, search_results: List[List], local_code: int, school_code: int) -> Tuple[int, str, int]:
+        """Pick the requested school out of the search results."""
         if len(search_results) == 0:
             raise RuntimeError('School not found')
         elif len(search_results) > 1:
-            return self._handle_multiple_schools(search_results, school_code, local_code)
+            return cls._handle_multiple_schools(search_results, school_code, local_code)
         else:
             # Single school found
             result = search_results[0]
@@ -166,24 +217,55 @@ class TimeTable:
         raise RuntimeError('Multiple schools found - please specify school_code or local_code')
 
     @staticmethod
-    def _fetch_timetable_data(school_code: int, week_num: int, comcigan_codes: Tuple) -> dict:
+    def _fetch_timetable_data(school_code: int, week_num: int, comcigan_codes: Tuple,
+                              client: Optional[ComciganClient] = None) -> dict:
         """Fetch timetable data from Comcigan API."""
+        client = client or get_default_client()
+        observer = current_observer()
+        if observer is None:
+            response = client.get(TimeTable._timetable_path(school_code, week_num, comcigan_codes), encoding='UTF-8')
+            return TimeTable._parse_timetable_response(response.content)
+
+        start = time.perf_counter()
+        response = client.get(TimeTable._timetable_path(school_code, week_num, comcigan_codes), encoding='UTF-8')
+        content = response.content
+        emit(observer, TIMETABLE_DOWNLOAD, start, len(content))
+
+        start = time.perf_counter()
+        data = TimeTable._parse_timetable_response(content)
+        emit(observer, JSON_PARSE, start, len(content))
+        return data
+
+    @staticmethod
+    def _timetable_path(school_code: int, week_num: int, comcigan_codes: Tuple) -> str:
+        """Build the timetable request path with base64 encoded parameters."""
         comcigan_code, code0, *_ = comcigan_codes
 
-        # Encode request parameters
         encoded_params = base64.b64encode(f"{code0}_{school_code}_0_{week_num + 1}".encode('utf-8'))
-        request_url = f'{COMCIGAN_URL}{comcigan_code[:7]}{str(encoded_params)[2:-1]}'
-
-        response = requests.get(request_url, headers=HEADERS)
-        response.encoding = 'UTF-8'
+        return f'{comcigan_code[:7]}{str(encoded_params)[2:-1]}'
 
-        # Parse first line of response as JSON
-        json_data = response.text.split('\n')[0]
-        return json.loads(json_data)
+    @staticmethod
+    def _parse_timetable_response(content: Union[bytes, str]) -> dict:
+        """Parse first line of a timetable response (raw or decoded) as JSON."""
+        return parse_timetable_body(content)
+
+    @classmethod
+    def _from_data(cls, data: dict, local_code: int, school_name: str, school_code: int,
+                   comcigan_codes: Tuple, client: Optional[ComciganClient] = None, lazy: bool = False,
+                   week_num: int = 0) -> 'TimeTable':
+        """Create an instance from already fetched timetable data, without any network access."""
+        timetable = cls.__new__(cls)
+        timetable._client = client
+        timetable._lazy = lazy
+        timetable._week_num = week_num
+        timetable._initialize_from_data(data, local_code, school_name, school_code, comcigan_codes)
+        return timetable
 
     def _initialize_from_data(self, data: dict, local_code: int, school_name: str, school_code: int,
                               comcigan_codes: Tuple) -> None:
         """Initialize instance variables from fetched data."""
+        observer = current_observer()
+        start = time.perf_counter() if observer is not None else 0.0
         _, _, code1, code2, code3, code4, code5 = comcigan_codes
 
         # Set basic school information
@@ -202,114 +284,104 @@ class TimeTable:
         subject_list = data["자료" + code2]
         subject_list[0] = ""
 
-        # Build timetable data structure
-        self.timetable = self._build_timetable(
-            data, teacher_list, subject_list, code4, code5
-        )
+        # Pack the raw period codes and build timetable data structure
+        self._set_grid(PeriodGrid.from_payload(
+            data["자료" + code4], data["자료" + code5], subject_list, teacher_list
+        ))
 
         # Process homeroom teacher information
         self._homeroom_teacher = self._process_homeroom_teachers(
             data["담임"], teacher_list
         )
 
-    def _build_timetable(self, data: dict, teacher_list: List[str], subject_list: List[str], code4: str, code5: str) -> \
-            List[List[List[List[TimeTableData]]]]:
-        """Build the complete timetable data structure."""
-        original_timetable = data["자료" + code5]
-        current_timetable = data["자료" + code4]
-        timetable = []
+        if observer is not None:
+            emit(observer, BUILD, start)
+
+    def _set_grid(self, grid: PeriodGrid) -> None:
+        """Use packed period codes as the source of the timetable."""
+        self._index = None
+        self._grid = grid
+        if self._lazy:
+            self.timetable = self._build_lazy_timetable(grid)
+        else:
+            self.timetable = self._build_timetable(grid)
 
-        for grade_idx, grade_data in enumerate(current_timetable):
-            if grade_idx == 0:
-                timetable.append([])
-                continue
+    def _build_timetable(self, grid: PeriodGrid) -> List[List[List[List[TimeTableData]]]]:
+        """Build the complete timetable data structure."""
+        timetable = [[]]  # Start with empty grade 0
 
+        for grade_idx in range(1, grid.grades):
             grade_timetable = [[]]  # Start with empty class 0
 
-            for class_idx, class_data in enumerate(grade_data):
-                if class_idx == 0:
-                    continue
+            for class_idx in range(1, grid.class_count(grade_idx)):
+                class_timetable = [[]]  # Start with empty day 0
+
+                for day in range(1, grid.day_count(grade_idx, class_idx) + 1):
+                    class_timetable.append(self._build_day_timetable(grid, grade_idx, class_idx, day))
 
-                class_timetable = self._build_class_timetable(
-                    grade_idx, class_idx, class_data, original_timetable,
-                    teacher_list, subject_list
-                )
                 grade_timetable.append(class_timetable)
 
             timetable.append(grade_timetable)
 
         return timetable
 
-    def _build_class_timetable(self, grade_idx: int, class_idx: int, class_data: List,
-                               original_timetable: List, teacher_list: List[str],
-                               subject_list: List[str]) -> List[List[TimeTableData]]:
-        """Build timetable for a specific class with guaranteed 8 periods per day."""
-        class_timetable = [[]]  # Start with empty day 0
-        original_class = original_timetable[grade_idx][class_idx]
-
-        for day in range(1, original_class[0] + 1):
-            day_timetable = []
-
-            # Ensure we always have 8 periods per day
-            max_periods = max(
-                original_class[day][0] if day < len(original_class) else 0,
-                class_data[day][0] if day < len(class_data) else 0,
-                8  # Force minimum 8 periods
-            )
+    def _build_lazy_timetable(self, grid: PeriodGrid) -> LazyGrid:
+        """Build a timetable that decodes each day from the packed codes on first access."""
+        return LazyGrid(
+            grade_count=grid.grades,
+            class_count=grid.class_count,
+            day_count=grid.day_count,
+            decode_day=lambda grade_idx, class_idx, day: self._build_day_timetable(grid, grade_idx, class_idx, day)
+        )
 
-            for period in range(1, max_periods + 1):
-                period_data = self._create_period_data(
-                    period, day, class_data, original_class,
-                    teacher_list, subject_list
-                )
-                day_timetable.append(period_data)
+    @classmethod
+    def _build_day_timetable(cls, grid: PeriodGrid, grade_idx: int, class_idx: int,
+                             day: int) -> List[TimeTableData]:
+        """Build timetable for a single day of a class with guaranteed 8 periods."""
+        offset = grid.offset(grade_idx, class_idx, day) if day < grid.days else -1
+        current = grid.current
+        original = grid.original
+
+        # Ensure we always have 8 periods per day
+        max_periods = max(
+            original[offset] if offset >= 0 else 0,
+            current[offset] if offset >= 0 else 0,
+            8  # Force minimum 8 periods
+        )
 
-            class_timetable.append(day_timetable)
+        day_timetable = []
+        for period in range(1, max_periods + 1):
+            # Periods past the packed width (or the day's count) are stored/treated as empty
+            in_range = offset >= 0 and period < grid.periods
+            day_timetable.append(cls._create_period_data(
+                period,
+                current[offset + period] if in_range else 0,
+                original[offset + period] if in_range else 0,
+                grid
+            ))
 
-        return class_timetable
+        return day_timetable
 
     @staticmethod
-    def _create_period_data(period: int, day: int, class_data: List,
-                            original_class: List, teacher_list: List[str],
-                            subject_list: List[str]) -> TimeTableData:
-        """Create TimeTableData for a specific period."""
-        # Get original period data (handle bounds checking)
-        original_period = 0
-        if (day < len(original_class) and
-                len(original_class[day]) > 0 and
-                period <= original_class[day][0] and
-                period < len(original_class[day])):
-            original_period = original_class[day][period]
-
-        # Get current period data (handle bounds checking)
-        current_period = 0
-        if (day < len(class_data) and
-                len(class_data[day]) > 0 and
-                period <= class_data[day][0] and
-                period < len(class_data[day])):
-            current_period = class_data[day][period]
-
+    def _create_period_data(period: int, current_period: int, original_period: int,
+                            grid: PeriodGrid) -> TimeTableData:
+        """Create TimeTableData for a specific period from its current and original codes."""
         # Create original lecture if replacement occurred
         original_lecture = None
         if current_period != original_period and original_period != 0:
             original_lecture = Lecture(
                 period=period,
-                subject=subject_list[original_period // 1000] if original_period // 1000 < len(subject_list) else "",
-                teacher=teacher_list[original_period % 100] if original_period % 100 < len(teacher_list) else ""
+                subject=grid.subject(original_period),
+                teacher=grid.teacher(original_period)
             )
 
-        # Get subject and teacher names with bounds checking
+        # Get subject and teacher names (empty when there is no class)
         subject_name = ""
         teacher_name = ""
 
         if current_period != 0:
-            subject_idx = current_period // 1000
-            teacher_idx = current_period % 100
-
-            if subject_idx < len(subject_list):
-                subject_name = subject_list[subject_idx]
-            if teacher_idx < len(teacher_list):
-                teacher_name = teacher_list[teacher_idx]
+            subject_name = grid.subject(current_period)
+            teacher_name = grid.teacher(current_period)
 
         return TimeTableData(
             period=period,
@@ -351,6 +423,193 @@ class TimeTable:
             return self._homeroom_teacher[grade - 1][cls - 1]
         return ""
 
+    def save(self, path: str, format: str = 'binary') -> None:
+        """
+        Save a snapshot of the timetable that can be loaded without network access.
+
+        Args:
+            path (str): Destination file
+            format (str): 'binary' (compact, memory-mappable) or 'json' (gzip compressed JSON)
+        """
+        state = {
+            'school_code': self.school_code,
+            'school_name': self.school_name,
+            'local_code': self.local_code,
+            'local_name': self.local_name,
+            'school_year': self.school_year,
+            'start_date': self.start_date,
+            'day_time': self.day_time,
+            'update_date': self.update_date,
+            'week_num': self._week_num,
+            'homeroom': self._homeroom_teacher,
+        }
+        save_snapshot(path, state, self._grid, format)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = False, lazy: bool = True,
+             client: Optional[ComciganClient] = None) -> 'TimeTable':
+        """
+        Load a timetable snapshot saved with save(), without network access.
+
+        Args:
+            path (str): Snapshot file
+            mmap (bool): Memory-map a binary snapshot so processes share its pages
+            lazy (bool): Decode each day of the timetable on first access (default: True)
+            client (ComciganClient, optional): Client used by refresh()
+
+        Returns:
+            TimeTable: The loaded timetable
+
+        Raises:
+            ValueError: If the file is not a snapshot or has an unsupported version
+        """
+        state, grid = load_snapshot(path, use_mmap=mmap)
+
+        timetable = cls.__new__(cls)
+        timetable._client = client
+        timetable._lazy = lazy
+        timetable._week_num = state['week_num']
+        timetable.school_code = state['school_code']
+        timetable.school_name = state['school_name']
+        timetable.local_code = state['local_code']
+        timetable.local_name = state['local_name']
+        timetable.school_year = state['school_year']
+        timetable.start_date = state['start_date']
+        timetable.day_time = state['day_time']
+        timetable.update_date = state['update_date']
+        timetable._homeroom_teacher = state['homeroom']
+        timetable._set_grid(grid)
+        return timetable
+
+    def refresh(self) -> List[Change]:
+        """
+        Fetch the timetable again and apply the changes in place.
+
+        Nothing is decoded when the update timestamp (자료(code3)) has not
+        changed. Otherwise only the days containing changed periods are
+        rebuilt, along with days whose number of periods changed, unless the
+        shape or the subject/teacher tables changed.
+
+        Returns:
+            List[Change]: Changed periods (empty if nothing changed)
+        """
+        client = self._client or get_default_client()
+
+        def fetch(codes: Tuple) -> Tuple[dict, str]:
+            data = self._fetch_timetable_data(self.school_code, self._week_num, codes, client)
+            return data, data["자료" + codes[4]]
+
+        (data, update_date), comcigan_codes = code_cache.call_with_codes(client, fetch)
+        if update_date == self.update_date:
+            return []
+        return self._update_from_data(data, comcigan_codes)
+
+    def _update_from_data(self, data: dict, comcigan_codes: Tuple) -> List[Change]:
+        """Replace the timetable with newer data and return what changed."""
+        # Pack the new codes into a separate instance without decoding, so a
+        # malformed payload leaves this one untouched
+        new = self._from_data(data, self.local_code, self.school_name, self.school_code, comcigan_codes,
+                              lazy=True, week_num=self._week_num)
+        old_grid = self._grid
+        grid = new._grid
+
+        changes = diff_grids(old_grid, grid)
+        if self._lazy:
+            timetable = self._build_lazy_timetable(grid)
+        elif (old_grid.subjects == grid.subjects and old_grid.teachers == grid.teachers and
+              same_shape(old_grid, grid)):
+            # Decode only the days that changed
+            timetable = self.timetable
+            days = {(change.grade, change.cls, change.day) for change in changes}
+            days |= resized_days(old_grid, grid)
+            for grade_idx, class_idx, day in days:
+                timetable[grade_idx][class_idx][day] = self._build_day_timetable(grid, grade_idx, class_idx, day)
+        else:
+            timetable = self._build_timetable(grid)
+
+        self.local_name = new.local_name
+        self.school_year = new.school_year
+        self.start_date = new.start_date
+        self.day_time = new.day_time
+        self.update_date = new.update_date
+        self._homeroom_teacher = new._homeroom_teacher
+        self._index = None
+        self._grid = grid
+        self.timetable = timetable
+        return changes
+
+    @property
+    def index(self) -> TimeTableIndex:
+        """Teacher, subject and free-period indexes, built on first use."""
+        if self._index is None:
+            self._index = TimeTableIndex(self._grid)
+        return self._index
+
+    def teacher_schedule(self, teacher: str, day: Optional[int] = None) -> List[Slot]:
+        """
+        Get every period a teacher teaches.
+
+        Args:
+            teacher (str): Name of the teacher
+            day (int, optional): Only return periods of this day
+
+        Returns:
+            List[Slot]: (grade, cls, day, period, subject, teacher) of each period
+        """
+        return self.index.teacher_schedule(teacher, day)
+
+    def classes_with(self, subject: str, day: int, period: int) -> List[Tuple[int, int]]:
+        """
+        Get the classes having a subject in a period.
+
+        Args:
+            subject (str): Name of the subject
+            day (int): Day (TimeTable.MONDAY ~ TimeTable.FRIDAY)
+            period (int): Period number
+
+        Returns:
+            List[Tuple[int, int]]: (grade, class) of each class
+        """
+        return self.index.classes_with(subject, day, period)
+
+    def free_teachers(self, day: int, period: int) -> List[str]:
+        """
+        Get the teachers without a class in a period.
+
+        Args:
+            day (int): Day (TimeTable.MONDAY ~ TimeTable.FRIDAY)
+            period (int): Period number
+
+        Returns:
+            List[str]: Names of the free teachers
+        """
+        return self.index.free_teachers(day, period)
+
+    def to_numpy(self) -> TimeTableArrays:
+        """
+        Export the timetable as NumPy arrays shaped (grade, class, day, period), without decoding any period.
+
+        Returns:
+            TimeTableArrays: Raw current/original period codes, period counts and subject/teacher tables
+
+        Raises:
+            RuntimeError: If numpy is not installed
+        """
+        return to_arrays(self._grid)
+
+    def to_dataframe(self):
+        """
+        Export the timetable as a long format pandas DataFrame with one row per period.
+
+        Returns:
+            pandas.DataFrame: grade, cls, day, period, subject/teacher codes and names, replaced and
+                the original lecture
+
+        Raises:
+            RuntimeError: If numpy or pandas is not installed
+        """
+        return to_dataframe(self._grid)
+
     def __str__(self) -> str:
         return (f"School Code: {self.school_code}\n"
                 f"School Name: {self.school_name}\n"
@@ -0,0 +1,17 @@
+import pytest
+
+from pycomcigan import ComciganClient, RequestPolicy
+from pycomcigan.fake_server import FakeComciganServer
+
+
+@pytest.fixture
+def server():
+    with FakeComciganServer() as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    # No backoff so retry tests don't sleep
+    with ComciganClient(server.url, policy=RequestPolicy(backoff=0)) as client:
+        yield client
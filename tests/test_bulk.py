@@ -0,0 +1,48 @@
+import time
+
+import pytest
+
+from pycomcigan import RateLimiter, TimeTable, fetch_many
+
+
+def test_fetch_many_isolates_failures(server, client):
+    schools = [("경기북과학고", 0, 0), ("없는학교", 0, 0), ("과학고", 0, 0), ("서울과학고", 0, 0)]
+    results = {result.school: result for result in fetch_many(schools, client=client)}
+
+    assert set(results) == set(schools)
+    assert results[("경기북과학고", 0, 0)].ok
+    assert results[("서울과학고", 0, 0)].timetable.school_code == 41234
+    assert str(results[("없는학교", 0, 0)].error) == 'School not found'
+    assert isinstance(results[("과학고", 0, 0)].error, RuntimeError)  # Ambiguous name
+
+    expected = TimeTable("경기북과학고", client=client)
+    assert str(results[("경기북과학고", 0, 0)].timetable.timetable) == str(expected.timetable)
+
+
+def test_fetch_many_rejects_invalid_weeks(client):
+    with pytest.raises(ValueError):
+        list(fetch_many([("경기북과학고", 0, 0)], week_num=2, client=client))
+
+
+def test_rate_limiter_paces_requests():
+    limiter = RateLimiter(rate=20, burst=2)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+    # Two tokens are available right away, the other four take 1/20 s each
+    assert 0.18 <= time.monotonic() - start < 0.5
+
+    with pytest.raises(ValueError):
+        RateLimiter(0)
+
+
+def test_fetch_many_respects_rate_limit(server, client):
+    TimeTable("경기북과학고", client=client)
+    sent = len(server.requests)
+    start = time.monotonic()
+    results = list(fetch_many([("경기북과학고", 0, 0), ("서울과학고", 0, 0)], client=client, rate_limit=10))
+
+    assert all(result.ok for result in results)
+    # Two searches and two timetable requests, the first without waiting
+    assert len(server.requests) - sent == 4
+    assert time.monotonic() - start >= 0.28
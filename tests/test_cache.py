@@ -0,0 +1,74 @@
+import threading
+import time
+
+from pycomcigan import TimeTableCache
+from pycomcigan.fake_server import DEFAULT_CODES
+
+
+def _timetable_requests(server) -> int:
+    code = DEFAULT_CODES['comcigan_code'][1:]
+    return sum(1 for path in server.requests if path.startswith(code[:7]) and not path.startswith(code))
+
+
+def test_concurrent_misses_share_one_fetch(server, client):
+    server.latency = 0.05
+    with TimeTableCache(client=client) as cache:
+        barrier = threading.Barrier(8)
+        results = []
+
+        def get():
+            barrier.wait()
+            results.append(cache.get("경기북과학고"))
+
+        threads = [threading.Thread(target=get) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 8 and all(result is results[0] for result in results)
+        assert _timetable_requests(server) == 1
+        assert server.requests.count('/st') == 1
+        assert cache.stats()['misses'] == 8
+
+
+def test_stale_entry_is_served_while_refreshing(server, client):
+    with TimeTableCache(client=client, ttl=0.05, max_stale=60) as cache:
+        first = cache.get("경기북과학고")
+        assert cache.get("경기북과학고") is first
+        assert cache.stats()['hits'] == 1
+
+        time.sleep(0.06)
+        server.latency = 0.2
+        start = time.perf_counter()
+        assert cache.get("경기북과학고") is first
+        assert time.perf_counter() - start < 0.1
+        assert cache.stats()['stale_hits'] == 1
+
+        # The background refresh replaces the entry
+        deadline = time.monotonic() + 5
+        while cache.get("경기북과학고") is first and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert cache.get("경기북과학고") is not first
+        assert _timetable_requests(server) == 2
+
+
+def test_expired_entry_is_fetched_again(server, client):
+    with TimeTableCache(client=client, ttl=0, max_stale=0) as cache:
+        first = cache.get("경기북과학고")
+        assert cache.get("경기북과학고") is not first
+        assert cache.stats()['misses'] == 2
+
+
+def test_stale_entry_is_served_after_close(server, client):
+    cache = TimeTableCache(client=client, ttl=0.05, max_stale=0.2)
+    first = cache.get("경기북과학고")
+    cache.close()
+
+    time.sleep(0.06)
+    assert cache.get("경기북과학고") is first
+    assert cache.stats()['refreshes'] == 0
+
+    # Once expired, the entry is fetched again in the caller's thread
+    time.sleep(0.2)
+    assert cache.get("경기북과학고") is not first
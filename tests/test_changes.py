@@ -0,0 +1,113 @@
+import copy
+
+import pytest
+
+from pycomcigan import TimeTable, diff
+from pycomcigan.changes import CHANGED, REPLACED, REVERTED, TEACHER_CHANGED
+from pycomcigan.fake_server import DEFAULT_CODES
+
+CURRENT = "자료" + DEFAULT_CODES['code4']
+ORIGINAL = "자료" + DEFAULT_CODES['code5']
+UPDATE_DATE = "자료" + DEFAULT_CODES['code3']
+
+
+def _find(payload: dict, replaced: bool, skip=()):
+    """(grade, cls, day, period) of the first period with or without a replacement."""
+    current_timetable, original_timetable = payload[CURRENT], payload[ORIGINAL]
+    for grade_idx in range(1, len(current_timetable)):
+        for class_idx in range(1, len(current_timetable[grade_idx])):
+            for day in range(1, current_timetable[grade_idx][class_idx][0] + 1):
+                current = current_timetable[grade_idx][class_idx][day]
+                original = original_timetable[grade_idx][class_idx][day]
+                for period in range(1, current[0] + 1):
+                    position = (grade_idx, class_idx, day, period)
+                    if (current[period] != original[period]) == replaced and position not in skip:
+                        return position
+    raise AssertionError('no such period')
+
+
+def _set(payload: dict, key: str, position, code: int) -> None:
+    grade_idx, class_idx, day, period = position
+    payload[key][grade_idx][class_idx][day][period] = code
+
+
+def _get(payload: dict, key: str, position) -> int:
+    grade_idx, class_idx, day, period = position
+    return payload[key][grade_idx][class_idx][day][period]
+
+
+def test_refresh_classifies_changes(server, client):
+    timetable = TimeTable("경기북과학고", client=client)
+    old = TimeTable("경기북과학고", client=client, lazy=True)
+    payload = copy.deepcopy(server.timetable_payload(timetable.school_code))
+
+    replaced = _find(payload, replaced=False)
+    reverted = _find(payload, replaced=True)
+    teacher_changed = _find(payload, replaced=False, skip={replaced})
+    changed = _find(payload, replaced=False, skip={replaced, teacher_changed})
+
+    code = _get(payload, ORIGINAL, replaced)
+    _set(payload, CURRENT, replaced, (code // 1000 % 60 + 1) * 1000 + code % 100)
+    _set(payload, CURRENT, reverted, _get(payload, ORIGINAL, reverted))
+    code = _get(payload, ORIGINAL, teacher_changed)
+    for key in (CURRENT, ORIGINAL):
+        _set(payload, key, teacher_changed, code // 1000 * 1000 + code % 100 % 90 + 1)
+    code = _get(payload, ORIGINAL, changed)
+    for key in (CURRENT, ORIGINAL):
+        _set(payload, key, changed, (code // 1000 % 60 + 1) * 1000 + code % 100)
+    payload[UPDATE_DATE] = "2023-11-02 08:00:00"
+    server.timetables[timetable.school_code] = payload
+
+    changes = timetable.refresh()
+    kinds = {(change.grade, change.cls, change.day, change.period): change.kind for change in changes}
+    assert kinds == {replaced: REPLACED, reverted: REVERTED, teacher_changed: TEACHER_CHANGED, changed: CHANGED}
+    assert changes == sorted(changes, key=lambda change: (change.grade, change.cls, change.day, change.period))
+
+    # The refreshed timetable matches a fresh fetch, and diff() agrees with refresh()
+    fresh = TimeTable("경기북과학고", client=client)
+    assert str(timetable.timetable) == str(fresh.timetable)
+    assert diff(old, fresh) == changes
+    assert timetable.refresh() == []
+
+
+def test_refresh_rebuilds_days_whose_period_count_changed(server, client):
+    timetable = TimeTable("경기북과학고", client=client)
+    payload = copy.deepcopy(server.timetable_payload(timetable.school_code))
+    for key in (CURRENT, ORIGINAL):
+        payload[key][1][1][1][0] = 12
+    payload[UPDATE_DATE] = "2023-11-02 08:00:00"
+    server.timetables[timetable.school_code] = payload
+
+    assert timetable.refresh() == []
+    assert len(timetable.timetable[1][1][1]) == 12
+    assert str(timetable.timetable) == str(TimeTable("경기북과학고", client=client).timetable)
+
+
+def test_diff_of_the_same_update_is_empty(client):
+    assert diff(TimeTable("경기북과학고", client=client), TimeTable("경기북과학고", client=client)) == []
+
+
+def test_failed_refresh_leaves_the_timetable_untouched(server, client):
+    for lazy in (False, True):
+        timetable = TimeTable("경기북과학고", client=client, lazy=lazy)
+        update_date = timetable.update_date
+        before = str(timetable.timetable)
+
+        good = copy.deepcopy(server.timetable_payload(timetable.school_code))
+        _set(good, CURRENT, _find(good, replaced=False), 1001)
+        good[UPDATE_DATE] = "2023-11-02 08:00:00"
+        broken = copy.deepcopy(good)
+        del broken["담임"]
+        server.timetables[timetable.school_code] = broken
+
+        with pytest.raises(KeyError):
+            timetable.refresh()
+        assert timetable.update_date == update_date
+        assert timetable._lazy is lazy
+        assert isinstance(timetable.timetable, list) is not lazy
+        assert str(timetable.timetable) == before
+
+        # The changes are still reported once the server sends a valid payload
+        server.timetables[timetable.school_code] = good
+        assert len(timetable.refresh()) == 1
+        server.timetables.pop(timetable.school_code)
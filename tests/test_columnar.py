@@ -0,0 +1,65 @@
+import pytest
+
+from pycomcigan import ComciganClient, RequestPolicy, TimeTable
+from pycomcigan.columnar import DATAFRAME_COLUMNS
+from pycomcigan.fake_server import DEFAULT_CODES, FakeComciganServer
+
+pytest.importorskip('numpy')
+
+
+def _periods(timetable: TimeTable) -> dict:
+    """Decoded periods keyed by (grade, cls, day, period)."""
+    periods = {}
+    for grade in range(1, len(timetable.timetable)):
+        for cls in range(1, len(timetable.timetable[grade])):
+            for day in range(1, len(timetable.timetable[grade][cls])):
+                for data in timetable.timetable[grade][cls][day]:
+                    periods[grade, cls, day, data.period] = data
+    return periods
+
+
+def test_to_numpy_shape():
+    with FakeComciganServer(grades=2, classes=4, days=5, periods=7) as server, \
+            ComciganClient(server.url, policy=RequestPolicy(backoff=0)) as client:
+        arrays = TimeTable("경기북과학고", client=client).to_numpy()
+
+    # Index 0 of the grade, class and day axes is empty and slot 0 is zeroed
+    assert arrays.current.shape == arrays.original.shape
+    assert arrays.current.shape[:3] == (3, 5, 6)
+    assert arrays.current.shape[3] >= 8
+    assert not arrays.current[..., 0].any() and not arrays.original[..., 0].any()
+    assert arrays.period_counts.shape == (3, 5, 6)
+    assert arrays.period_counts[1:, 1:, 1:].max() <= 7
+
+
+def test_to_numpy_matches_the_decoded_timetable(server, client):
+    timetable = TimeTable("경기북과학고", client=client)
+    arrays = timetable.to_numpy()
+
+    assert not arrays.current[..., 0].any() and not arrays.original[..., 0].any()
+    assert arrays.period_counts.shape == arrays.current.shape[:3]
+
+    periods = _periods(timetable)
+    assert periods
+    original = server.timetable_payload(timetable.school_code)["자료" + DEFAULT_CODES['code5']]
+    assert arrays.period_counts[1, 1, 1] == original[1][1][1][0]
+    for (grade, cls, day, period), data in periods.items():
+        assert arrays.subjects[arrays.current_subject[grade, cls, day, period]] == data.subject
+        assert arrays.teachers[arrays.current_teacher[grade, cls, day, period]] == data.teacher
+        assert arrays.replaced[grade, cls, day, period] == data.replaced
+
+
+def test_to_dataframe_rows(client):
+    pytest.importorskip('pandas')
+    timetable = TimeTable("경기북과학고", client=client)
+    frame = timetable.to_dataframe()
+
+    assert list(frame.columns) == DATAFRAME_COLUMNS
+    periods = _periods(timetable)
+    taught = {key: data for key, data in periods.items() if data.subject or data.teacher or data.replaced}
+    assert len(frame) == len(taught)
+    for row in frame.head(50).itertuples(index=False):
+        data = periods[row.grade, row.cls, row.day, row.period]
+        assert (row.subject, row.teacher, row.replaced) == (data.subject, data.teacher, data.replaced)
+        if data.replaced and data.original is not None:
+            assert row.original_subject == data.original.subject
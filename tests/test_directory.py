@@ -0,0 +1,58 @@
+from pycomcigan import SchoolDirectory, TimeTable
+from pycomcigan.directory import normalize_name
+from pycomcigan.fake_server import DEFAULT_SCHOOLS
+
+
+def _names(schools):
+    return [school[2] for school in schools]
+
+
+def test_normalize_name():
+    assert normalize_name("경기북과학고등학교") == "경기북과학고"
+    assert normalize_name(" 경기북 과학고 ") == "경기북과학고"
+    assert normalize_name("서울여자고등학교") == "서울여고"
+    assert normalize_name("한빛중학교") == normalize_name("한빛중")
+    assert normalize_name("ABC초등학교") == "abc초"
+
+
+def test_prefix_matches_full_and_abbreviated_names():
+    directory = SchoolDirectory(DEFAULT_SCHOOLS)
+
+    for query in ("경기북", "경기북과학고", "경기북과학고등", "경기북과학고등학", "경기북과학고등학교"):
+        assert _names(directory.prefix(query)) == ["경기북과학고등학교"], query
+    assert _names(directory.prefix("경기")) == ["경기과학고등학교", "경기북과학고등학교"]
+    assert len(directory.prefix("경기", limit=1)) == 1
+    assert directory.prefix("부산") == []
+
+
+def test_search_matches_full_and_abbreviated_names():
+    directory = SchoolDirectory(DEFAULT_SCHOOLS)
+    everything = ["경기과학고등학교", "경기북과학고등학교", "서울과학고등학교"]
+
+    assert _names(directory.search("과학고등")) == everything
+    assert _names(directory.search("학교")) == everything
+    assert _names(directory.search("북과학")) == ["경기북과학고등학교"]
+    assert directory.search("여고") == []
+
+    directory.add([[12345, "서울", "서울여자고등학교", 41235]])
+    assert _names(directory.search("여고")) == ["서울여자고등학교"]
+    assert _names(directory.prefix("서울여자")) == ["서울여자고등학교"]
+
+
+def test_resolve_only_trusts_unambiguous_names():
+    directory = SchoolDirectory(DEFAULT_SCHOOLS + [[12345, "서울", "경기과학고등학교", 99999]])
+
+    assert directory.resolve("경기북과학고") == (24966, "경기북과학고등학교", 12045)
+    assert directory.resolve("경기북과학고등학교") == (24966, "경기북과학고등학교", 12045)
+    # Partial names are never trusted, the directory may not know every school
+    assert directory.resolve("경기북") is None
+    # Two schools share the name
+    assert directory.resolve("경기과학고") is None
+    assert directory.resolve("경기과학고", local_code=12345) == (12345, "경기과학고등학교", 99999)
+    assert directory.resolve("경기과학고", school_code=12046) == (24966, "경기과학고등학교", 12046)
+
+
+def test_known_school_skips_the_search_request(server, client):
+    directory = SchoolDirectory(DEFAULT_SCHOOLS)
+    TimeTable("경기북과학고", client=client, directory=directory)
+    assert not any(path.startswith(server.codes['comcigan_code'][1:]) for path in server.requests)
@@ -0,0 +1,52 @@
+from pycomcigan import Slot, TimeTable
+
+
+def _slots(timetable: TimeTable) -> list:
+    """Every taught period, found by scanning the decoded timetable."""
+    slots = []
+    for grade in range(1, len(timetable.timetable)):
+        for cls in range(1, len(timetable.timetable[grade])):
+            for day in range(1, len(timetable.timetable[grade][cls])):
+                for data in timetable.timetable[grade][cls][day]:
+                    if data.subject or data.teacher:
+                        slots.append(Slot(grade, cls, day, data.period, data.subject, data.teacher))
+    return slots
+
+
+def test_teacher_schedule(client):
+    timetable = TimeTable("경기북과학고", client=client)
+    slots = _slots(timetable)
+    teacher = slots[0].teacher
+
+    expected = sorted((slot for slot in slots if slot.teacher == teacher), key=lambda slot: (slot.day, slot.period))
+    schedule = timetable.teacher_schedule(teacher)
+    assert sorted(schedule) == sorted(expected)
+    assert [(slot.day, slot.period) for slot in schedule] == [(slot.day, slot.period) for slot in expected]
+    assert timetable.teacher_schedule(teacher, day=2) == [slot for slot in schedule if slot.day == 2]
+    assert timetable.teacher_schedule("없는선생님") == []
+
+
+def test_classes_with(client):
+    timetable = TimeTable("경기북과학고", client=client)
+    slot = _slots(timetable)[0]
+
+    expected = [(other.grade, other.cls) for other in _slots(timetable)
+                if (other.subject, other.day, other.period) == (slot.subject, slot.day, slot.period)]
+    assert timetable.classes_with(slot.subject, slot.day, slot.period) == expected
+    assert (slot.grade, slot.cls) in expected
+    assert timetable.classes_with("없는과목", 1, 1) == []
+
+
+def test_free_teachers_and_periods(client):
+    timetable = TimeTable("경기북과학고", client=client)
+    slots = _slots(timetable)
+    busy = {slot.teacher for slot in slots if (slot.day, slot.period) == (1, 1)}
+
+    free = timetable.free_teachers(1, 1)
+    assert free and not busy & set(free)
+    assert busy <= set(timetable.index.teachers())
+
+    teacher = free[0]
+    assert 1 in timetable.index.free_periods(teacher, 1)
+    taught = {slot.period for slot in slots if slot.teacher == teacher and slot.day == 1}
+    assert not taught & set(timetable.index.free_periods(teacher, 1))
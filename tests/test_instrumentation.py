@@ -0,0 +1,41 @@
+from pycomcigan import TimeTable, TimingStats, instrument
+from pycomcigan.instrumentation import (BUILD, CODE_CACHE, JSON_PARSE, SEARCH, ST_DOWNLOAD, TIMETABLE_DOWNLOAD,
+                                        TOTAL)
+
+
+def test_timetable_reports_every_phase(client):
+    events = []
+    with instrument(events.append):
+        TimeTable("경기북과학고", client=client)
+
+    phases = [event.phase for event in events]
+    assert {ST_DOWNLOAD, CODE_CACHE, SEARCH, TIMETABLE_DOWNLOAD, JSON_PARSE, BUILD, TOTAL} <= set(phases)
+    assert phases[-1] == TOTAL
+    assert all(event.duration >= 0 for event in events)
+    assert next(event for event in events if event.phase == TIMETABLE_DOWNLOAD).bytes > 0
+
+
+def test_code_cache_hits_and_misses(client):
+    stats = TimingStats()
+    with instrument(stats):
+        TimeTable("경기북과학고", client=client)
+        TimeTable("서울과학고", client=client)
+
+    summary = stats.summary()
+    assert summary[TOTAL]['count'] == 2
+    assert summary[CODE_CACHE]['misses'] == 1
+    assert summary[CODE_CACHE]['hits'] == summary[CODE_CACHE]['count'] - 1
+    assert summary[ST_DOWNLOAD]['count'] == 1
+    assert summary[TOTAL]['p50'] <= summary[TOTAL]['max']
+
+    stats.reset()
+    assert stats.summary() == {}
+    assert stats.percentile(TOTAL, 50) == 0.0
+
+
+def test_no_events_outside_instrument(client):
+    events = []
+    with instrument(events.append):
+        pass
+    TimeTable("경기북과학고", client=client)
+    assert events == []
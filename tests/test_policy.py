@@ -0,0 +1,141 @@
+import asyncio
+import time
+
+import pytest
+import requests
+
+from pycomcigan import CircuitBreaker, CircuitOpenError, ComciganClient, RequestPolicy
+from pycomcigan.aio import AsyncComciganClient, AsyncTransport, HTTPStatusError
+
+
+def test_breaker_state_transitions():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    assert breaker.state == 'closed'
+
+    breaker.record_failure()
+    assert breaker.state == 'closed' and breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == 'open' and not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.state == 'half_open'
+    assert breaker.allow()
+    assert not breaker.allow()  # Only one trial request at a time
+
+    breaker.record_failure()
+    assert breaker.state == 'open'
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == 'closed' and breaker.allow()
+
+
+def test_retries_5xx(server, client):
+    server.fail_next(2)
+    assert client.get('/st').status_code == 200
+    assert len(server.requests) == 3
+
+
+def test_raises_after_the_last_5xx(server, client):
+    server.fail_next(3)
+    with pytest.raises(requests.HTTPError):
+        client.get('/st')
+    assert len(server.requests) == 3
+
+
+def test_does_not_retry_other_statuses(server, client):
+    assert client.get('/missing').status_code == 404
+    assert len(server.requests) == 1
+
+
+def test_open_breaker_fails_fast(server):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    policy = RequestPolicy(retries=1, backoff=0, breaker=breaker)
+    with ComciganClient(server.url, policy=policy) as client:
+        server.fail_next(2)
+        with pytest.raises(requests.HTTPError):
+            client.get('/st')
+        assert breaker.state == 'open'
+
+        with pytest.raises(CircuitOpenError):
+            client.get('/st')
+        assert len(server.requests) == 2
+
+
+def test_hedged_request_wins_over_a_slow_one():
+    calls = []
+
+    def send(timeout):
+        calls.append(timeout)
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = f'attempt {len(calls)}'
+        if len(calls) == 1:
+            time.sleep(0.5)
+        return response
+
+    policy = RequestPolicy(hedge=True, hedge_after=0.05)
+    start = time.perf_counter()
+    assert policy.execute(send).reason == 'attempt 2'
+    assert time.perf_counter() - start < 0.4
+
+
+def test_async_client_applies_the_policy(server):
+    async def main():
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+        policy = RequestPolicy(retries=2, backoff=0, breaker=breaker)
+        async with AsyncComciganClient(server.url, policy=policy) as client:
+            server.fail_next(2)
+            assert '<script>' in await client.get('/st', 'euc-kr')
+            assert len(server.requests) == 3
+
+            with pytest.raises(HTTPStatusError) as error:
+                await client.get('/missing')
+            assert error.value.status == 404 and len(server.requests) == 4
+
+            server.fail_next(3)
+            with pytest.raises(HTTPStatusError) as error:
+                await client.get('/st')
+            assert error.value.status == 500 and breaker.state == 'open'
+
+            with pytest.raises(CircuitOpenError):
+                await client.get('/st')
+            assert len(server.requests) == 7
+
+    asyncio.run(main())
+
+
+def test_async_client_defaults_to_the_policy_timeout():
+    assert AsyncComciganClient().timeout == 20.0
+    assert AsyncComciganClient(policy=RequestPolicy(timeout=3.0)).timeout == 3.0
+    assert AsyncComciganClient(timeout=1.0).timeout == 1.0
+
+
+def test_async_hedged_request_wins_over_a_slow_one():
+    class SlowFirstTransport(AsyncTransport):
+        def __init__(self):
+            self.calls = 0
+            self.cancelled = 0
+
+        async def get(self, url, headers, timeout):
+            self.calls += 1
+            if self.calls == 1:
+                try:
+                    await asyncio.sleep(0.5)
+                except asyncio.CancelledError:
+                    self.cancelled += 1
+                    raise
+            return b'attempt %d' % self.calls
+
+    async def main():
+        transport = SlowFirstTransport()
+        client = AsyncComciganClient('http://comcigan.invalid', transport=transport,
+                                     policy=RequestPolicy(hedge=True, hedge_after=0.05))
+        start = time.perf_counter()
+        assert await client.get('/st') == 'attempt 2'
+        assert time.perf_counter() - start < 0.4
+        await asyncio.sleep(0)
+        assert transport.cancelled == 1
+
+    asyncio.run(main())
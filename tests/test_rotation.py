@@ -0,0 +1,79 @@
+import asyncio
+
+from pycomcigan import TimeTable, TimeTableCache, fetch_many, get_school_code
+from pycomcigan.aio import AsyncComciganClient, AsyncTimeTable
+from pycomcigan.aio import get_school_code as get_school_code_async
+from pycomcigan.fake_server import DEFAULT_CODES
+
+ROTATED_CODES = dict(DEFAULT_CODES, comcigan_code='./98765?43210l', code0='11111', code4='999', code5='888')
+
+
+def test_timetable_recovers_from_rotated_codes(server, client):
+    TimeTable("경기북과학고", client=client)
+    server.rotate_codes(ROTATED_CODES)
+
+    timetable = TimeTable("경기북과학고", client=client)
+    assert timetable.school_code == 12045
+    assert server.requests.count('/st') == 2
+
+
+def test_search_recovers_from_rotated_codes(server, client):
+    get_school_code("경기", client=client)
+    server.rotate_codes(ROTATED_CODES)
+
+    assert [school[3] for school in get_school_code("경기", client=client)] == [12045, 12046]
+
+
+def test_refresh_recovers_from_rotated_codes(server, client):
+    timetable = TimeTable("경기북과학고", client=client)
+    server.rotate_codes(ROTATED_CODES)
+
+    assert timetable.refresh() == []
+    assert server.requests.count('/st') == 2
+
+
+def test_fetch_many_and_cache_recover_from_rotated_codes(server, client):
+    TimeTable("경기북과학고", client=client)
+    server.rotate_codes(ROTATED_CODES)
+
+    results = list(fetch_many([("경기북과학고", 0, 0), ("서울과학고", 0, 0)], client=client))
+    assert all(result.ok for result in results)
+
+    server.rotate_codes(DEFAULT_CODES)
+    with TimeTableCache(client=client) as cache:
+        assert cache.get("경기과학고").school_code == 12046
+
+
+def test_async_recovers_from_rotated_codes(server):
+    async def main():
+        async with AsyncComciganClient(server.url) as client:
+            await AsyncTimeTable.create("경기북과학고", client=client)
+            server.rotate_codes(ROTATED_CODES)
+            assert len(await get_school_code_async("경기", client=client)) == 2
+
+            server.rotate_codes(DEFAULT_CODES)
+            timetable = await AsyncTimeTable.create("경기북과학고", client=client)
+            assert timetable.school_code == 12045
+
+    asyncio.run(main())
+
+
+def test_timetable_requests_recover_from_rotated_codes(server, client):
+    # The search code stays the same, so only the timetable requests fail with the cached codes
+    rotated = dict(DEFAULT_CODES, code0='11111', code4='999')
+    TimeTable("경기북과학고", client=client)
+    server.rotate_codes(rotated)
+    assert TimeTable("경기북과학고", client=client).school_code == 12045
+
+    server.rotate_codes(DEFAULT_CODES)
+    assert all(result.ok for result in fetch_many([("경기북과학고", 0, 0)], client=client, rate_limit=100))
+
+    async def main():
+        async with AsyncComciganClient(server.url) as async_client:
+            timetable = await AsyncTimeTable.create("경기북과학고", client=async_client)
+            server.rotate_codes(rotated)
+            assert await timetable.refresh() == []
+            assert (await AsyncTimeTable.create("경기북과학고", client=async_client)).school_code == 12045
+
+    asyncio.run(main())
+    assert server.requests.count('/st') == 5
@@ -0,0 +1,73 @@
+import copy
+
+from pycomcigan import TimeTable
+from pycomcigan.fake_server import DEFAULT_CODES
+
+
+def _baseline_periods(payload: dict) -> list:
+    """Decode a payload the way TimeTable did before the packed grid, as (grade, cls, day, period, ...) tuples."""
+    payload = copy.deepcopy(payload)
+    teachers = payload["자료" + DEFAULT_CODES['code1']]
+    subjects = payload["자료" + DEFAULT_CODES['code2']]
+    teachers[0] = subjects[0] = ""
+    current_timetable = payload["자료" + DEFAULT_CODES['code4']]
+    original_timetable = payload["자료" + DEFAULT_CODES['code5']]
+
+    def code_at(day_data, period):
+        return day_data[period] if day_data and period <= day_data[0] and period < len(day_data) else 0
+
+    def names(code):
+        subject = subjects[code // 1000] if code // 1000 < len(subjects) else ""
+        teacher = teachers[code % 100] if code % 100 < len(teachers) else ""
+        return (subject, teacher) if code else ("", "")
+
+    periods = []
+    for grade_idx in range(1, len(current_timetable)):
+        for class_idx in range(1, len(current_timetable[grade_idx])):
+            current_class = current_timetable[grade_idx][class_idx]
+            original_class = original_timetable[grade_idx][class_idx]
+            for day in range(1, original_class[0] + 1):
+                for period in range(1, max(original_class[day][0], current_class[day][0], 8) + 1):
+                    current = code_at(current_class[day], period)
+                    original = code_at(original_class[day], period)
+                    original_names = names(original) if current != original and original else None
+                    periods.append((grade_idx, class_idx, day, period, *names(current), current != original,
+                                    original_names))
+    return periods
+
+
+def _periods(timetable: TimeTable) -> list:
+    periods = []
+    for grade_idx in range(1, len(timetable.timetable)):
+        for class_idx in range(1, len(timetable.timetable[grade_idx])):
+            for day in range(1, len(timetable.timetable[grade_idx][class_idx])):
+                for data in timetable.timetable[grade_idx][class_idx][day]:
+                    original = (data.original.subject, data.original.teacher) if data.original else None
+                    periods.append((grade_idx, class_idx, day, data.period, data.subject, data.teacher,
+                                    data.replaced, original))
+    return periods
+
+
+def test_eager_lazy_and_baseline_decode_the_same_grid(server, client):
+    eager = TimeTable("경기북과학고", client=client)
+    lazy = TimeTable("경기북과학고", client=client, lazy=True)
+    baseline = _baseline_periods(server.timetable_payload(eager.school_code))
+
+    assert len(baseline) > 0
+    assert _periods(eager) == baseline
+    assert _periods(lazy) == baseline
+    assert any(period[6] for period in baseline)
+
+
+def test_save_and_load_round_trip(client, tmp_path):
+    timetable = TimeTable("경기북과학고", client=client)
+    expected = _periods(timetable)
+
+    for format, mmap in (('binary', False), ('binary', True), ('json', False), ('json', True)):
+        path = str(tmp_path / f'snapshot.{format}')
+        timetable.save(path, format=format)
+        for lazy in (False, True):
+            loaded = TimeTable.load(path, mmap=mmap, lazy=lazy)
+            assert _periods(loaded) == expected, (format, mmap, lazy)
+            assert loaded.update_date == timetable.update_date
+            assert loaded.homeroom(1, 1) == timetable.homeroom(1, 1)